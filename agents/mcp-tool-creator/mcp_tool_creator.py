@@ -35,7 +35,7 @@ from typing import Dict, List, Any, Optional
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from shared.agent_base import (
     AgentInput, AgentOutput, BaseAnalyzer, AgentOrchestrator,
-    run_standard_cli, NLKE_ROOT, AGENTS_DIR,
+    run_standard_cli, dumps_json, NLKE_ROOT, AGENTS_DIR,
 )
 
 # Local imports
@@ -630,7 +630,7 @@ Examples:
         print(f"{'=' * 60}")
 
     if args.json:
-        print(json.dumps(asdict(result), indent=2, default=str))
+        print(dumps_json(result))
 
 
 if __name__ == "__main__":
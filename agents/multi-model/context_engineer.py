@@ -26,22 +26,35 @@ from shared.agent_base import (
     PRICING, GEMINI_MODELS, TOKENS_PER_MILLION,
 )
 
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 
 # ============================================================================
 # L1: Data Models
 # ============================================================================
 
-@dataclass
-class ContextLayer:
+class ContextLayer(NamedTuple):
+    """One context source. A NamedTuple: built in a single C-level call per source."""
     name: str
     layer: str  # global, project, local
     tokens: int
     priority: str  # critical, high, medium, low
     cacheable: bool
     utilization_pct: float  # how much is actually used per request
+    weight: float  # resolved PRIORITY_WEIGHTS entry for priority
 
 
 # ============================================================================
@@ -74,6 +87,13 @@ GEMINI_CONTEXT_LIMITS = {
 }
 CLAUDE_CONTEXT_LIMIT = 200_000
 
+# Comparable Gemini model per Claude tier (anything else falls back to the cheap default)
+GEMINI_TIER_MAP = {
+    "opus": "gemini-3-pro",
+    "sonnet": "gemini-2.5-pro",
+}
+GEMINI_DEFAULT_MODEL = "gemini-2.5-flash"
+
 # Gemini implicit caching: content reused within short time is cached automatically
 # Pricing: cached read is ~75% discount on input
 GEMINI_CACHE_DISCOUNT = 0.75
@@ -83,6 +103,30 @@ GEMINI_CACHE_MIN_TOKENS = 32_768  # Minimum tokens for context caching
 CONTEXT_OVERFLOW_THRESHOLD = 150_000  # Above this, consider Gemini
 CHUNKING_AVOIDANCE_THRESHOLD = 200_000  # Gemini eliminates chunking need
 
+# Below this many sources the NumPy array setup costs more than the Python loops
+VECTORIZE_MIN_SOURCES = 64
+# Above this many sources the numba kernel beats NumPy (below it, JIT dispatch dominates)
+NUMBA_MIN_SOURCES = 500
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, cache=True)
+    def _reduce_layers_kernel(tokens, util, weights, cacheable):
+        """Parallel token reductions over per-source arrays (see _reduce_layers)."""
+        n = tokens.shape[0]
+        opt_tokens = np.empty(n, dtype=np.int64)
+        total = 0
+        effective = 0.0
+        cacheable_sum = 0
+        for i in numba.prange(n):
+            t = tokens[i]
+            total += t
+            effective += t * util[i]
+            if cacheable[i]:
+                cacheable_sum += t
+            opt_tokens[i] = np.int64(t * max(weights[i], util[i]))
+        return total, effective, opt_tokens, cacheable_sum
+
 
 # ============================================================================
 # L3: Analyzer
@@ -133,25 +177,41 @@ class ContextEngineerAnalyzer(BaseAnalyzer):
 
         layers = []
         for src in sources:
+            priority = src.get("priority", "medium")
             layers.append(ContextLayer(
                 name=src["name"],
                 layer=src.get("layer", "project"),
                 tokens=src.get("tokens", 1000),
-                priority=src.get("priority", "medium"),
+                priority=priority,
                 cacheable=src.get("cacheable", False),
                 utilization_pct=src.get("utilization_pct", 50),
+                weight=PRIORITY_WEIGHTS.get(priority, 0.5),
             ))
 
-        # Current state
-        total_tokens = sum(l.tokens for l in layers)
-        effective_tokens = sum(l.tokens * l.utilization_pct / 100 for l in layers)
-        waste_pct = (1 - effective_tokens / max(1, total_tokens)) * 100
+        # Single fused pass: totals, optimized sources, layer breakdown and
+        # low-utilization sources are all accumulated in one walk of `layers`.
+        # Large audits get their token math precomputed by NumPy instead.
+        vectorized = self._reduce_layers(layers)
+        if vectorized is not None:
+            total_tokens, effective_tokens, opt_tokens_per_layer, cacheable_tokens = vectorized
+        else:
+            total_tokens, effective_tokens, opt_tokens_per_layer, cacheable_tokens = 0, 0, None, 0
 
-        # Optimized state
         optimized_layers = []
-        for l in layers:
-            weight = PRIORITY_WEIGHTS.get(l.priority, 0.5)
-            opt_tokens = int(l.tokens * max(weight, l.utilization_pct / 100))
+        opt_total = 0
+        count_by_layer = Counter()
+        tokens_by_layer = Counter()
+        low_util = []
+        for i, l in enumerate(layers):
+            if opt_tokens_per_layer is None:
+                total_tokens += l.tokens
+                effective_tokens += l.tokens * l.utilization_pct / 100
+                if l.cacheable:
+                    cacheable_tokens += l.tokens
+                opt_tokens = int(l.tokens * max(l.weight, l.utilization_pct / 100))
+            else:
+                opt_tokens = opt_tokens_per_layer[i]
+            opt_total += opt_tokens
             optimized_layers.append({
                 "name": l.name,
                 "original_tokens": l.tokens,
@@ -161,7 +221,22 @@ class ContextEngineerAnalyzer(BaseAnalyzer):
                 "priority": l.priority,
             })
 
-        opt_total = sum(o["optimized_tokens"] for o in optimized_layers)
+            # Layer breakdown
+            count_by_layer[l.layer] += 1
+            tokens_by_layer[l.layer] += l.tokens
+
+            if l.utilization_pct < 30 and l.tokens > 2000:
+                low_util.append(l)
+
+        by_layer = {
+            layer: {"count": count, "tokens": tokens_by_layer[layer]}
+            for layer, count in count_by_layer.items()
+        }
+
+        # Current state
+        waste_pct = (1 - effective_tokens / max(1, total_tokens)) * 100
+
+        # Optimized state
         reduction = (1 - opt_total / max(1, total_tokens)) * 100
 
         # Cost analysis
@@ -170,23 +245,14 @@ class ContextEngineerAnalyzer(BaseAnalyzer):
         optimized_monthly = (opt_total / TOKENS_PER_MILLION * model_input_price * rpd * 20)
 
         # Caching savings
-        cacheable_tokens = sum(l.tokens for l in layers if l.cacheable)
         cache_savings = (cacheable_tokens * CACHE_HIT_RATE / TOKENS_PER_MILLION *
                         (model_input_price - PRICING["cache_read"]) * rpd * 20)
 
         final_monthly = optimized_monthly - cache_savings
 
-        # Layer breakdown
-        by_layer = {}
-        for l in layers:
-            by_layer.setdefault(l.layer, {"count": 0, "tokens": 0})
-            by_layer[l.layer]["count"] += 1
-            by_layer[l.layer]["tokens"] += l.tokens
-
         anti_patterns = []
         if waste_pct > 50:
             anti_patterns.append(f"Context waste is {waste_pct:.0f}% - major optimization needed")
-        low_util = [l for l in layers if l.utilization_pct < 30 and l.tokens > 2000]
         for l in low_util:
             anti_patterns.append(f"Low utilization ({l.utilization_pct}%): {l.name} ({l.tokens} tokens)")
 
@@ -250,15 +316,37 @@ class ContextEngineerAnalyzer(BaseAnalyzer):
             agent_metadata=self.build_metadata(),
         )
 
+    def _reduce_layers(self, layers: List[ContextLayer]) -> Optional[Tuple[int, float, List[int], int]]:
+        """Vectorized token reductions: (total, effective, optimized per layer, cacheable).
+
+        Returns None when numpy is unavailable or the audit is too small to
+        benefit, in which case analyze() accumulates the same values inline.
+        """
+        if not HAS_NUMPY or len(layers) < VECTORIZE_MIN_SOURCES:
+            return None
+        n = len(layers)
+        tokens = np.fromiter((l.tokens for l in layers), dtype=np.int64, count=n)
+        util = np.fromiter((l.utilization_pct for l in layers), dtype=np.float64, count=n) / 100
+        weights = np.fromiter((l.weight for l in layers), dtype=np.float64, count=n)
+        cacheable = np.fromiter((l.cacheable for l in layers), dtype=bool, count=n)
+        if HAS_NUMBA and n > NUMBA_MIN_SOURCES:
+            total, effective, opt_tokens, cacheable_sum = _reduce_layers_kernel(
+                tokens, util, weights, cacheable,
+            )
+            return int(total), float(effective), opt_tokens.tolist(), int(cacheable_sum)
+        opt_tokens = (tokens * np.maximum(weights, util)).astype(np.int64)
+        return (
+            int(tokens.sum()),
+            float((tokens * util).sum()),
+            opt_tokens.tolist(),
+            int(tokens[cacheable].sum()),
+        )
+
     def _analyze_gemini_context(self, total_tokens: int, cacheable_tokens: int,
                                  model: str, rpd: int) -> Dict:
         """Analyze cost/benefit of using Gemini for context handling."""
         # Find comparable Gemini model
-        gemini_model = "gemini-2.5-flash"  # Default cheap option
-        if model == "opus":
-            gemini_model = "gemini-3-pro"
-        elif model == "sonnet":
-            gemini_model = "gemini-2.5-pro"
+        gemini_model = GEMINI_TIER_MAP.get(model, GEMINI_DEFAULT_MODEL)
 
         gemini_pricing = GEMINI_MODELS.get(gemini_model, {"input": 0.15, "output": 0.60})
         gemini_monthly = (total_tokens / TOKENS_PER_MILLION * gemini_pricing["input"] * rpd * 20)
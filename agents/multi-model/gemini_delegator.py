@@ -19,10 +19,17 @@ Updated: February 6, 2026 (v2.1 - Tier 2 Gemini enhancement)
 import sys
 import os
 import json
+import random
 import time
-import hashlib
-import urllib.request
+import asyncio
+import base64
+import threading
+import http.client
 import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from shared.agent_base import (
@@ -30,8 +37,20 @@ from shared.agent_base import (
     GEMINI_API_BASE, GEMINI_MODELS, GEMINI_CAPABILITIES, TOKENS_PER_MILLION,
 )
 
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Any, Hashable, NamedTuple, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 # ============================================================================
@@ -53,6 +72,33 @@ class DelegationResult:
     latency_ms: float = 0.0
 
 
+class DryRunEstimate(NamedTuple):
+    """Cost estimate for a task that is not executed.
+
+    Same fields as DelegationResult, as a lightweight tuple for dry runs.
+    """
+    task_name: str
+    model: str
+    success: bool
+    response_text: str
+    input_tokens: int
+    output_tokens: int
+    estimated_cost: float
+    error: Optional[str] = None
+    retries: int = 0
+    cached: bool = False
+    latency_ms: float = 0.0
+
+
+class _GenerateFailed(Exception):
+    """A generateContent call that exhausted its retries (raised so it is not cached)."""
+
+    def __init__(self, error: Optional[str], retries: int):
+        super().__init__(error)
+        self.error = error
+        self.retries = retries
+
+
 # ============================================================================
 # L2: Constants
 # ============================================================================
@@ -93,10 +139,153 @@ MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # seconds
 RETRY_BACKOFF_FACTOR = 2.0
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRY_AFTER = 60.0  # seconds; cap on a server-supplied Retry-After
+
+# Batch concurrency (in-flight Gemini calls per delegate_batch; keep under QPM limits)
+MAX_CONCURRENCY = 16
+
+# Dry-run estimates: fallback pricing, assumed output size, and the batch
+# size above which the NumPy path beats per-task Python arithmetic
+DEFAULT_MODEL_PRICING = {"input": 1.0, "output": 4.0}
+DRY_RUN_OUTPUT_TOKENS = 1000
+VECTORIZE_MIN_TASKS = 64
+DRY_RUN_TEXT = "[dry run - not executed]"
 
-# Response cache (in-memory, keyed by prompt hash)
-_response_cache: Dict[str, DelegationResult] = {}
+# Opt-in countTokens pre-flight runs alongside generateContent, not before it
+_preflight_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gemini-preflight")
+
+# Worker threads for blocking batch calls, shared by concurrent batches (each
+# caps its own in-flight calls with a semaphore). Kept across batches so each
+# worker's keep-alive connection stays warm; threads start on demand.
+_batch_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="gemini-batch")
+
+# Keep-alive HTTP connection to the Gemini API host, one per worker thread
+_API_URL = urllib.parse.urlsplit(GEMINI_API_BASE)
+_API_PATH = _API_URL.path.rstrip("/")
+_JSON_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+# Placeholder spliced out of pre-serialized payload templates (see _payload_template)
+_PROMPT_PLACEHOLDER = "__PROMPT__"
+_PROMPT_SLOT = json.dumps(_PROMPT_PLACEHOLDER).encode("utf-8")
+_conn_local = threading.local()
+
+# Response cache size (lru_cache on _cached_generate, shared by all analyzers)
 MAX_CACHE_SIZE = 100
+# .executed: whether the last call reached the API; .generate: the call a cache miss runs
+_call_state = threading.local()
+
+# DelegationResult is flat (and DryRunEstimate shares its fields), so a
+# field-name walk replaces the recursive asdict()
+_RESULT_FIELDS = tuple(f.name for f in fields(DelegationResult))
+
+
+def _result_dict(r: Union[DelegationResult, DryRunEstimate]) -> Dict[str, Any]:
+    """Serialize a DelegationResult or DryRunEstimate (shallow equivalent of asdict)."""
+    return {name: getattr(r, name) for name in _RESULT_FIELDS}
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Request body bytes (orjson when installed, else stdlib json)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _decode_json(data: bytes) -> Any:
+    """Parse a response body; orjson reads the bytes without a decode step."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _retry_delay(attempt: int, headers=None) -> float:
+    """Seconds to wait before retry `attempt + 1`.
+
+    Honors a numeric Retry-After header (429/503 responses); otherwise
+    exponential backoff with jitter so parallel batch workers spread out.
+    """
+    retry_after = headers.get("Retry-After") if headers is not None else None
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), MAX_RETRY_AFTER)
+        except ValueError:
+            pass  # HTTP-date form: fall back to backoff
+    delay = RETRY_BASE_DELAY * (RETRY_BACKOFF_FACTOR ** attempt)
+    return delay * (0.5 + random.random())
+
+
+def _new_connection(timeout: float) -> http.client.HTTPConnection:
+    """Connection to the API host, tunnelled through the environment's proxy.
+
+    Honors HTTPS_PROXY/HTTP_PROXY and NO_PROXY (urllib.request.getproxies /
+    proxy_bypass) the way urlopen does.
+    """
+    conn_cls = (http.client.HTTPSConnection if _API_URL.scheme == "https"
+                else http.client.HTTPConnection)
+    proxy = urllib.request.getproxies().get(_API_URL.scheme)
+    if not proxy or urllib.request.proxy_bypass(_API_URL.hostname):
+        return conn_cls(_API_URL.netloc, timeout=timeout)
+
+    proxy_url = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    conn = conn_cls(proxy_url.netloc.rpartition("@")[2], timeout=timeout)
+    tunnel_headers = {}
+    if proxy_url.username:
+        credentials = (f"{urllib.parse.unquote(proxy_url.username)}:"
+                       f"{urllib.parse.unquote(proxy_url.password or '')}")
+        tunnel_headers["Proxy-Authorization"] = (
+            "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii"))
+    conn.set_tunnel(_API_URL.hostname, _API_URL.port, headers=tunnel_headers)
+    return conn
+
+
+def _post_json(path: str, body: bytes, timeout: float) -> bytes:
+    """POST a JSON body to the Gemini API over this thread's pooled connection.
+
+    Raises urllib.error.HTTPError for HTTP error statuses, like urlopen did.
+    """
+    conn = getattr(_conn_local, "conn", None)
+    reused = conn is not None
+    if conn is None:
+        conn = _conn_local.conn = _new_connection(timeout)
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    try:
+        conn.request("POST", path, body=body, headers=_JSON_HEADERS)
+        resp = conn.getresponse()
+        data = resp.read()
+    except (http.client.BadStatusLine, ConnectionError):
+        conn.close()
+        _conn_local.conn = None
+        if not reused:
+            raise
+        return _post_json(path, body, timeout)  # Stale keep-alive socket: reconnect once
+    except Exception:
+        conn.close()
+        _conn_local.conn = None
+        raise
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(
+            f"{_API_URL.scheme}://{_API_URL.netloc}{path}",
+            resp.status, resp.reason, resp.headers, None,
+        )
+    return data
+
+
+def _request_key(model: str, prompt: str, task_type: str,
+                 system_instruction: Optional[str], use_preflight: bool) -> tuple:
+    """Default response cache key: the request, without the API key."""
+    return (model, prompt, task_type, system_instruction, use_preflight)
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _cached_generate(cache_key: Hashable) -> Tuple[str, int, int, float, int, float]:
+    """Response cache shared by every analyzer instance.
+
+    A miss runs the call staged in _call_state.generate, so entries hold no
+    analyzer reference. Failures raise _GenerateFailed and are not cached.
+    """
+    return _call_state.generate()
 
 
 # ============================================================================
@@ -113,6 +302,12 @@ class GeminiDelegatorAnalyzer(BaseAnalyzer):
             version="2.1",
         )
         self.api_key = os.environ.get("GEMINI_API_KEY", "")
+        # Request paths (with the key query string) per (api_key, model, action)
+        self._endpoints: Dict[tuple, str] = {}
+        if self.api_key:
+            for model in GEMINI_MODELS:
+                for action in ("generateContent", "countTokens"):
+                    self._endpoint(self.api_key, model, action)
 
     def get_example_input(self) -> Dict[str, Any]:
         return {
@@ -134,26 +329,30 @@ class GeminiDelegatorAnalyzer(BaseAnalyzer):
             "dry_run": False,
         }
 
+    def _endpoint(self, api_key: str, model: str, action: str) -> str:
+        """Request path for `model:action`, built once and then looked up."""
+        key = (api_key, model, action)
+        path = self._endpoints.get(key)
+        if path is None:
+            path = self._endpoints[key] = f"{_API_PATH}/models/{model}:{action}?key={api_key}"
+        return path
+
     def _count_tokens(self, model: str, prompt: str) -> int:
         """Pre-flight token count (free Gemini API call)."""
         if not self.api_key:
             return len(prompt) // 4  # Fallback estimate
-        url = f"{GEMINI_API_BASE}/models/{model}:countTokens?key={self.api_key}"
-        payload = json.dumps({
+        path = self._endpoint(self.api_key, model, "countTokens")
+        payload = _encode_json({
             "contents": [{"parts": [{"text": prompt}]}],
-        }).encode("utf-8")
-        req = urllib.request.Request(
-            url, data=payload,
-            headers={"Content-Type": "application/json"},
-        )
+        })
         try:
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+            data = _decode_json(_post_json(path, payload, timeout=15))
             return data.get("totalTokens", len(prompt) // 4)
         except Exception:
             return len(prompt) // 4
 
-    def _build_payload(self, model: str, prompt: str, task_type: str,
+    @staticmethod
+    def _build_payload(model: str, prompt: str, task_type: str,
                        system_instruction: str = None,
                        use_structured_output: bool = True,
                        use_search_grounding: bool = False) -> dict:
@@ -183,16 +382,40 @@ class GeminiDelegatorAnalyzer(BaseAnalyzer):
 
         return payload
 
-    def _cache_key(self, model: str, prompt: str, task_type: str) -> str:
-        """Generate cache key from model + prompt + task_type."""
-        raw = f"{model}:{task_type}:{prompt}"
-        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _payload_template(system_instruction: Optional[str],
+                          use_structured_output: bool,
+                          use_search_grounding: bool) -> bytes:
+        """Serialized payload with a prompt placeholder, built once per config.
+
+        _PROMPT_SLOT includes the quotes, so it only matches a JSON string
+        that is exactly the placeholder, never text containing it. The
+        prompt (contents) is serialized before the system instruction and
+        the caller replaces only the first occurrence, so a system
+        instruction that is itself the placeholder is left untouched.
+        """
+        payload = GeminiDelegatorAnalyzer._build_payload(
+            "", _PROMPT_PLACEHOLDER, "",
+            system_instruction=system_instruction,
+            use_structured_output=use_structured_output,
+            use_search_grounding=use_search_grounding,
+        )
+        return _encode_json(payload)
 
     def _call_gemini(self, model: str, prompt: str,
                      task_type: str = "analyze",
                      system_instruction: str = None,
-                     use_cache: bool = True) -> DelegationResult:
-        """Make Gemini API call with retry, caching, and all 5 best practices."""
+                     use_cache: bool = True,
+                     cache_key: Optional[Hashable] = None,
+                     use_preflight: bool = False) -> DelegationResult:
+        """Make Gemini API call with retry, caching, and all 5 best practices.
+
+        Responses are cached by request; pass `cache_key` to cache under a
+        caller-chosen key instead. The countTokens pre-flight is opt-in (`use_preflight`): generateContent
+        already reports usageMetadata, so by default the prompt token count
+        only falls back to a len(prompt) // 4 estimate.
+        """
         if not self.api_key:
             return DelegationResult(
                 task_name="api_call", model=model, success=False,
@@ -200,115 +423,226 @@ class GeminiDelegatorAnalyzer(BaseAnalyzer):
                 estimated_cost=0, error="GEMINI_API_KEY not set",
             )
 
-        # Check cache first
-        cache_k = self._cache_key(model, prompt, task_type)
-        if use_cache and cache_k in _response_cache:
-            cached = _response_cache[cache_k]
-            cached.cached = True
-            return cached
+        generate = partial(self._generate, self.api_key, model, prompt, task_type,
+                           system_instruction, use_preflight)
+        _call_state.executed = False
+        try:
+            if use_cache:
+                if cache_key is None:
+                    cache_key = _request_key(model, prompt, task_type, system_instruction, use_preflight)
+                _call_state.generate = generate
+                try:
+                    text, input_tok, output_tok, cost, retries, latency = _cached_generate(cache_key)
+                finally:
+                    _call_state.generate = None
+            else:
+                text, input_tok, output_tok, cost, retries, latency = generate()
+        except _GenerateFailed as e:
+            return DelegationResult(
+                task_name="api_call", model=model, success=False,
+                response_text="", input_tokens=0, output_tokens=0,
+                estimated_cost=0, error=e.error, retries=e.retries,
+            )
+        return DelegationResult(
+            task_name="api_call", model=model, success=True,
+            response_text=text, input_tokens=input_tok,
+            output_tokens=output_tok, estimated_cost=cost,
+            retries=retries, latency_ms=latency,
+            cached=not _call_state.executed,
+        )
+
+    def _generate(self, api_key: str, model: str, prompt: str, task_type: str,
+                  system_instruction: Optional[str],
+                  use_preflight: bool) -> Tuple[str, int, int, float, int, float]:
+        """One generateContent request with retries.
 
-        # Pre-flight: count tokens (free call)
-        preflight_tokens = self._count_tokens(model, prompt)
+        Returns (text, input_tokens, output_tokens, cost, retries, latency_ms);
+        raises _GenerateFailed once retries are exhausted.
+        """
+        _call_state.executed = True
 
         use_search = task_type == "search"
         use_structured = task_type != "search"
 
-        payload = self._build_payload(
-            model, prompt, task_type,
-            system_instruction=system_instruction,
-            use_structured_output=use_structured,
-            use_search_grounding=use_search,
-        )
+        template = self._payload_template(system_instruction, use_structured, use_search)
+        data_bytes = template.replace(_PROMPT_SLOT, _encode_json(prompt), 1)
+
+        path = self._endpoint(api_key, model, "generateContent")
 
-        url = f"{GEMINI_API_BASE}/models/{model}:generateContent?key={self.api_key}"
-        data_bytes = json.dumps(payload).encode("utf-8")
+        # Optional pre-flight: count tokens (free call), concurrently with generateContent.
+        # Its count is only a fallback for a response without usageMetadata, so it is
+        # cancelled (skipped if still queued) whenever it turns out not to be needed.
+        preflight = _preflight_pool.submit(self._count_tokens, model, prompt) if use_preflight else None
 
-        # Retry loop with exponential backoff
+        # Retry loop with jittered exponential backoff (or the server's Retry-After)
         last_error = None
         for attempt in range(MAX_RETRIES + 1):
-            if attempt > 0:
-                delay = RETRY_BASE_DELAY * (RETRY_BACKOFF_FACTOR ** (attempt - 1))
-                time.sleep(delay)
-
-            req = urllib.request.Request(
-                url, data=data_bytes,
-                headers={"Content-Type": "application/json"},
-            )
-
             start_ms = time.time() * 1000
             try:
-                with urllib.request.urlopen(req, timeout=60) as resp:
-                    data = json.loads(resp.read().decode("utf-8"))
+                data = _decode_json(_post_json(path, data_bytes, timeout=60))
                 latency = time.time() * 1000 - start_ms
 
                 text = data["candidates"][0]["content"]["parts"][0]["text"]
                 usage = data.get("usageMetadata", {})
-                input_tok = usage.get("promptTokenCount", preflight_tokens)
+                input_tok = usage.get("promptTokenCount")
+                if input_tok is None:
+                    input_tok = preflight.result() if preflight else len(prompt) // 4
+                elif preflight:
+                    preflight.cancel()
                 output_tok = usage.get("candidatesTokenCount", len(text) // 4)
 
                 model_pricing = GEMINI_MODELS.get(model, {"input": 1.0, "output": 4.0})
                 cost = (input_tok / TOKENS_PER_MILLION * model_pricing["input"] +
                         output_tok / TOKENS_PER_MILLION * model_pricing["output"])
 
-                result = DelegationResult(
-                    task_name="api_call", model=model, success=True,
-                    response_text=text, input_tokens=input_tok,
-                    output_tokens=output_tok, estimated_cost=round(cost, 6),
-                    retries=attempt, latency_ms=round(latency, 1),
-                )
-
-                # Store in cache
-                if use_cache and len(_response_cache) < MAX_CACHE_SIZE:
-                    _response_cache[cache_k] = result
-
-                return result
+                return text, input_tok, output_tok, round(cost, 6), attempt, round(latency, 1)
 
             except urllib.error.HTTPError as e:
                 last_error = f"HTTP {e.code}: {e.reason}"
-                if e.code not in RETRYABLE_STATUS_CODES:
-                    break  # Non-retryable error
+                if e.code not in RETRYABLE_STATUS_CODES or attempt == MAX_RETRIES:
+                    break
+                time.sleep(_retry_delay(attempt, e.headers))
             except Exception as e:
                 last_error = str(e)
                 if attempt == MAX_RETRIES:
                     break
-
-        return DelegationResult(
-            task_name="api_call", model=model, success=False,
-            response_text="", input_tokens=0, output_tokens=0,
-            estimated_cost=0, error=last_error,
-            retries=min(attempt, MAX_RETRIES),
+                time.sleep(_retry_delay(attempt))
+
+        if preflight:
+            preflight.cancel()
+        raise _GenerateFailed(last_error, min(attempt, MAX_RETRIES))
+
+    def _task_request_key(self, task: Dict) -> Hashable:
+        """Response cache key for a batch task; a caller-supplied task["cache_key"] wins."""
+        if task.get("cache_key"):
+            return task["cache_key"]
+        task_type = task.get("type", "analyze")
+        model = task.get("model", TASK_TO_MODEL.get(task_type, "gemini-2.5-flash"))
+        return _request_key(model, task.get("prompt", ""), task_type,
+                            task.get("system_instruction"), task.get("use_preflight", False))
+
+    def _estimate_task(self, task: Dict) -> DryRunEstimate:
+        """Cost estimate for a task that is not executed."""
+        task_type = task.get("type", "analyze")
+        prompt = task.get("prompt", "")
+        model = task.get("model", TASK_TO_MODEL.get(task_type, "gemini-2.5-flash"))
+        input_tok = len(prompt) // 4 if prompt else 5000
+        model_pricing = GEMINI_MODELS.get(model, DEFAULT_MODEL_PRICING)
+        cost = (input_tok / TOKENS_PER_MILLION * model_pricing["input"] +
+                DRY_RUN_OUTPUT_TOKENS / TOKENS_PER_MILLION * model_pricing["output"])
+        return DryRunEstimate(
+            task.get("name", "unnamed"), model, True, DRY_RUN_TEXT,
+            input_tok, DRY_RUN_OUTPUT_TOKENS, round(cost, 6),
         )
 
-    def delegate_batch(self, tasks: List[Dict], dry_run: bool = False) -> List[DelegationResult]:
-        """Delegate multiple tasks efficiently with shared session state."""
-        results = []
-        for task in tasks:
-            name = task.get("name", "unnamed")
-            task_type = task.get("type", "analyze")
-            prompt = task.get("prompt", "")
-            execute = task.get("execute", False) and not dry_run
-            model = task.get("model", TASK_TO_MODEL.get(task_type, "gemini-2.5-flash"))
-
-            if execute and prompt:
-                result = self._call_gemini(
-                    model, prompt, task_type=task_type,
-                    system_instruction=task.get("system_instruction"),
-                    use_cache=task.get("use_cache", True),
-                )
-                result.task_name = name
-            else:
-                input_tok = len(prompt) // 4 if prompt else 5000
-                model_pricing = GEMINI_MODELS.get(model, {"input": 1.0, "output": 4.0})
-                cost = (input_tok / TOKENS_PER_MILLION * model_pricing["input"] +
-                        1000 / TOKENS_PER_MILLION * model_pricing["output"])
-                result = DelegationResult(
-                    task_name=name, model=model, success=True,
-                    response_text="[dry run - not executed]",
-                    input_tokens=input_tok, output_tokens=1000,
-                    estimated_cost=round(cost, 6),
-                )
-            results.append(result)
-        return results
+    def _estimate_batch(self, tasks: List[Dict]) -> List[DryRunEstimate]:
+        """Dry-run estimates for a whole batch.
+
+        Large batches compute token estimates and costs in one NumPy pass,
+        with per-model prices resolved once per distinct model.
+        """
+        if not HAS_NUMPY or len(tasks) < VECTORIZE_MIN_TASKS:
+            return [self._estimate_task(task) for task in tasks]
+
+        n = len(tasks)
+        models = [
+            t.get("model", TASK_TO_MODEL.get(t.get("type", "analyze"), "gemini-2.5-flash"))
+            for t in tasks
+        ]
+        pricing = {m: GEMINI_MODELS.get(m, DEFAULT_MODEL_PRICING) for m in set(models)}
+        lens = np.fromiter((len(t.get("prompt", "")) for t in tasks), dtype=np.int64, count=n)
+        input_toks = np.where(lens > 0, lens // 4, 5000)
+        price_in = np.fromiter((pricing[m]["input"] for m in models), dtype=np.float64, count=n)
+        price_out = np.fromiter((pricing[m]["output"] for m in models), dtype=np.float64, count=n)
+        costs = (input_toks / TOKENS_PER_MILLION * price_in +
+                 DRY_RUN_OUTPUT_TOKENS / TOKENS_PER_MILLION * price_out)
+        return [
+            DryRunEstimate(
+                task.get("name", "unnamed"), model, True, DRY_RUN_TEXT,
+                input_tok, DRY_RUN_OUTPUT_TOKENS, round(cost, 6),
+            )
+            for task, model, input_tok, cost in zip(tasks, models, input_toks.tolist(), costs.tolist())
+        ]
+
+    def _delegate_task(self, task: Dict, dry_run: bool) -> Union[DelegationResult, DryRunEstimate]:
+        """Execute (or estimate) a single batch task."""
+        name = task.get("name", "unnamed")
+        task_type = task.get("type", "analyze")
+        prompt = task.get("prompt", "")
+        execute = task.get("execute", False) and not dry_run
+        model = task.get("model", TASK_TO_MODEL.get(task_type, "gemini-2.5-flash"))
+
+        if execute and prompt:
+            result = self._call_gemini(
+                model, prompt, task_type=task_type,
+                system_instruction=task.get("system_instruction"),
+                use_cache=task.get("use_cache", True),
+                cache_key=task.get("cache_key") or None,
+                use_preflight=task.get("use_preflight", False),
+            )
+            result.task_name = name
+        else:
+            result = self._estimate_task(task)
+        return result
+
+    async def delegate_batch_async(self, tasks: List[Dict], dry_run: bool = False,
+                                   concurrency: int = MAX_CONCURRENCY
+                                   ) -> List[Union[DelegationResult, DryRunEstimate]]:
+        """Delegate tasks concurrently, at most `concurrency` API calls in flight.
+
+        The blocking REST calls run on the shared batch thread pool
+        (http.client releases the GIL while waiting on the network); a
+        `concurrency` above MAX_CONCURRENCY gets its own pool for the batch.
+        Results keep task order.
+        """
+        concurrency = max(1, concurrency)
+        if concurrency > MAX_CONCURRENCY:
+            pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gemini-batch")
+            try:
+                return await self._run_batch(tasks, dry_run, concurrency, pool)
+            finally:
+                pool.shutdown(wait=False)  # don't block the event loop on its threads
+        return await self._run_batch(tasks, dry_run, concurrency, _batch_pool)
+
+    async def _run_batch(self, tasks: List[Dict], dry_run: bool, concurrency: int,
+                         pool: ThreadPoolExecutor) -> List[Union[DelegationResult, DryRunEstimate]]:
+        """delegate_batch_async body: run tasks on `pool`, `concurrency` at a time."""
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        in_flight: Dict[Hashable, asyncio.Task] = {}
+
+        async def run(task: Dict) -> Union[DelegationResult, DryRunEstimate]:
+            if dry_run or not (task.get("execute", False) and task.get("prompt")):
+                return self._delegate_task(task, dry_run)
+            if task.get("use_cache", True):
+                # Identical cacheable requests already in flight are awaited
+                # so this one is served from the cache
+                first = in_flight.setdefault(self._task_request_key(task), asyncio.current_task())
+                if first is not asyncio.current_task():
+                    await asyncio.wait([first])
+            async with semaphore:
+                return await loop.run_in_executor(pool, self._delegate_task, task, dry_run)
+
+        return list(await asyncio.gather(*(run(task) for task in tasks)))
+
+    def delegate_batch(self, tasks: List[Dict], dry_run: bool = False,
+                       concurrency: int = MAX_CONCURRENCY
+                       ) -> List[Union[DelegationResult, DryRunEstimate]]:
+        """Delegate multiple tasks concurrently (sync wrapper over delegate_batch_async).
+
+        Tasks that are not executed (all of them on a dry run) come back as
+        DryRunEstimate tuples, which carry the same fields as DelegationResult.
+        """
+        if dry_run:
+            return self._estimate_batch(tasks)
+        coro = self.delegate_batch_async(tasks, dry_run=dry_run, concurrency=concurrency)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # Called from inside an event loop (e.g. a FastAPI handler): use a helper thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
 
     def analyze(self, agent_input: AgentInput) -> AgentOutput:
         w = agent_input.workload
@@ -330,28 +664,32 @@ class GeminiDelegatorAnalyzer(BaseAnalyzer):
         ]
 
         # Use batch delegation method
-        results = self.delegate_batch(tasks, dry_run=dry_run)
-        total_cost = sum(r.estimated_cost for r in results)
-
-        successes = sum(1 for r in results if r.success)
-        failures = sum(1 for r in results if not r.success)
-        cached_hits = sum(1 for r in results if r.cached)
-        total_retries = sum(r.retries for r in results)
-
+        results = self.delegate_batch(
+            tasks, dry_run=dry_run,
+            concurrency=w.get("concurrency", MAX_CONCURRENCY),
+        )
+        # Totals, model distribution, failures and serialized results in one pass
+        total_cost = 0
+        successes = cached_hits = total_retries = 0
+        by_model: Dict[str, float] = {}
         anti_patterns = []
+        result_dicts = []
         for r in results:
+            total_cost += r.estimated_cost
+            successes += r.success
+            cached_hits += r.cached
+            total_retries += r.retries
+            by_model[r.model] = by_model.get(r.model, 0) + r.estimated_cost
             if r.error:
                 anti_patterns.append(f"FAILED: {r.task_name} - {r.error}")
+            result_dicts.append(_result_dict(r))
+        failures = len(results) - successes
+
         if total_retries > len(results):
             anti_patterns.append(
                 f"High retry rate: {total_retries} retries across {len(results)} tasks"
             )
 
-        # Model distribution
-        by_model: Dict[str, float] = {}
-        for r in results:
-            by_model[r.model] = by_model.get(r.model, 0) + r.estimated_cost
-
         recommendations = [{
             "technique": "gemini_delegation",
             "applicable": True,
@@ -361,7 +699,7 @@ class GeminiDelegatorAnalyzer(BaseAnalyzer):
             "cached_hits": cached_hits,
             "total_retries": total_retries,
             "total_cost_usd": round(total_cost, 6),
-            "results": [asdict(r) for r in results],
+            "results": result_dicts,
             "rules_applied": rules,
         }]
 
@@ -379,12 +717,12 @@ class GeminiDelegatorAnalyzer(BaseAnalyzer):
             rules_applied=rules,
             meta_insight=meta_insight,
             analysis_data={
-                "results": [asdict(r) for r in results],
+                "results": result_dicts,
                 "total_cost": round(total_cost, 6),
                 "by_model": {m: round(c, 6) for m, c in by_model.items()},
                 "cached_hits": cached_hits,
                 "total_retries": total_retries,
-                "cache_size": len(_response_cache),
+                "cache_size": _cached_generate.cache_info().currsize,
             },
             anti_patterns=anti_patterns,
             agent_metadata=self.build_metadata(),
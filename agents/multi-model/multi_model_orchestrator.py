@@ -19,6 +19,8 @@ Updated: February 6, 2026 (v1.1 - Tier 2 Gemini execution routing)
 
 import sys
 import os
+import importlib
+import importlib.util
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from shared.agent_base import (
@@ -26,8 +28,21 @@ from shared.agent_base import (
     PRICING, GEMINI_MODELS, GEMINI_CAPABILITIES, TOKENS_PER_MILLION,
 )
 
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, asdict, field, fields
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 
 # ============================================================================
@@ -98,6 +113,89 @@ CAPABILITY_TO_ROLE = {
     "embeddings": "embeddings",
 }
 
+# TaskAssignment is flat, so a field-name walk replaces the recursive asdict()
+_ASSIGNMENT_FIELDS = tuple(f.name for f in fields(TaskAssignment))
+
+# Upper bound on in-flight Gemini calls per parallel stage (keep under QPM limits)
+GEMINI_MAX_CONCURRENCY = 16
+
+# GeminiDelegatorAnalyzer class, resolved once per process (False if unavailable)
+_delegator_class = None
+
+# Per-task cost of the all-Opus baseline (5K context + 8K thinking in, 2K out)
+OPUS_BASELINE_TASK_COST = ((5000 + 8000) / TOKENS_PER_MILLION * 15.00 +
+                           2000 / TOKENS_PER_MILLION * 75.00)
+
+# Above this many assignments the numba kernel beats the Python aggregation loop
+NUMBA_MIN_TASKS = 1000
+
+
+@lru_cache(maxsize=None)
+def _select_model(role: str, priority: str) -> Tuple[str, Dict[str, Any]]:
+    """(model, ALL_MODELS config) for a role under a routing priority.
+
+    Depends only on the two strings, so each pair is resolved once per process
+    instead of once per task.
+    """
+    candidates = ROLE_TO_MODELS.get(role, ["sonnet"])
+    if priority == "cost-first":
+        model = min(candidates, key=lambda m: ALL_MODELS[m]["input"])
+    elif priority == "quality-first":
+        model = max(candidates, key=lambda m: ALL_MODELS[m]["input"])
+    else:
+        model = candidates[0]
+    return model, ALL_MODELS[model]
+
+
+def _load_delegator_class():
+    """Resolve GeminiDelegatorAnalyzer without exception-driven import probing.
+
+    Uses the importable `gemini_delegator` module when this directory is on
+    sys.path (reusing an already-imported copy), else loads the sibling file
+    the way agent_sdk loads agents. An ImportError while loading it (e.g. a
+    missing optional dependency) marks the delegator unavailable.
+    """
+    global _delegator_class
+    if _delegator_class is None:
+        module = sys.modules.get("gemini_delegator")
+        try:
+            if module is None and importlib.util.find_spec("gemini_delegator") is not None:
+                module = importlib.import_module("gemini_delegator")
+            if module is None:
+                path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gemini_delegator.py")
+                if os.path.exists(path):
+                    spec = importlib.util.spec_from_file_location("gemini_delegator", path)
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+        except ImportError:
+            module = None
+        _delegator_class = getattr(module, "GeminiDelegatorAnalyzer", None) or False
+    return _delegator_class or None
+
+
+if HAS_NUMBA and HAS_NUMPY:
+    @numba.njit(cache=True)
+    def _aggregate_costs_kernel(costs, is_gemini, baseline_cost):
+        """Sequential cost reductions over assignment arrays (see _aggregate_costs).
+
+        Kept serial so float sums accumulate in the same order as the Python loop.
+        """
+        total = 0.0
+        claude = 0.0
+        gemini = 0.0
+        baseline = 0.0
+        n_gemini = 0
+        for i in range(costs.shape[0]):
+            c = costs[i]
+            total += c
+            if is_gemini[i]:
+                gemini += c
+                n_gemini += 1
+            else:
+                claude += c
+            baseline += baseline_cost
+        return total, claude, gemini, baseline, n_gemini
+
 
 # ============================================================================
 # L3: Analyzer
@@ -117,15 +215,8 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
     def _get_delegator(self):
         """Lazy-load GeminiDelegatorAnalyzer for execution mode."""
         if self._delegator is None:
-            try:
-                from multi_model.gemini_delegator import GeminiDelegatorAnalyzer
-                self._delegator = GeminiDelegatorAnalyzer()
-            except ImportError:
-                try:
-                    from gemini_delegator import GeminiDelegatorAnalyzer
-                    self._delegator = GeminiDelegatorAnalyzer()
-                except ImportError:
-                    self._delegator = False  # Mark as unavailable
+            delegator_class = _load_delegator_class()
+            self._delegator = delegator_class() if delegator_class else False  # False: unavailable
         return self._delegator if self._delegator is not False else None
 
     def get_example_input(self) -> Dict[str, Any]:
@@ -190,15 +281,7 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
                 role = COMPLEXITY_TO_ROLE.get(complexity, "coder")
 
             # Select model based on role and priority
-            candidates = ROLE_TO_MODELS.get(role, ["sonnet"])
-            if priority == "cost-first":
-                model = min(candidates, key=lambda m: ALL_MODELS[m]["input"])
-            elif priority == "quality-first":
-                model = max(candidates, key=lambda m: ALL_MODELS[m]["input"])
-            else:
-                model = candidates[0]
-
-            config = ALL_MODELS[model]
+            model, config = _select_model(role, priority)
             thinking = THINKING_BY_COMPLEXITY.get(complexity, 4000)
             if config["provider"] == "gemini":
                 thinking = 0  # Gemini uses its own thinking
@@ -231,45 +314,34 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
                 parallel_group=parallel_group,
             ))
 
-        # Calculate costs
-        total_cost = sum(a.estimated_cost for a in assignments)
-        claude_cost = sum(a.estimated_cost for a in assignments if a.provider == "claude")
-        gemini_cost = sum(a.estimated_cost for a in assignments if a.provider == "gemini")
-
-        # All-opus baseline
-        all_opus_cost = sum(
-            ((5000 + 8000) / TOKENS_PER_MILLION * 15.00 +
-             2000 / TOKENS_PER_MILLION * 75.00)
-            for _ in assignments
+        # Costs, all-Opus baseline, and provider/model distribution
+        total_cost, claude_cost, gemini_cost, all_opus_cost, by_provider, by_model = (
+            self._aggregate_costs(assignments)
         )
         savings = (1 - total_cost / max(0.001, all_opus_cost)) * 100
 
-        # Provider distribution
-        by_provider = {"claude": 0, "gemini": 0}
-        by_model = {}
-        for a in assignments:
-            by_provider[a.provider] += 1
-            by_model[a.model] = by_model.get(a.model, 0) + 1
-
         # Execute Gemini tasks if requested
         gemini_execution_results = []
         if execute_gemini:
             delegator = self._get_delegator()
             if delegator:
-                gemini_tasks = [
-                    {
-                        "name": a.name,
-                        "type": "analyze",
-                        "prompt": f"Task: {a.name}",
-                        "model": a.model,
-                        "execute": True,
-                    }
-                    for a in assignments if a.provider == "gemini"
-                ]
-                if gemini_tasks:
-                    gemini_execution_results = delegator.delegate_batch(
-                        gemini_tasks, dry_run=False
-                    )
+                # One concurrent batch per parallel stage; stages run in order so
+                # a stage's dependencies have finished before it starts
+                stages: Dict[int, List[Dict]] = {}
+                for a in assignments:
+                    if a.provider == "gemini":
+                        stages.setdefault(a.parallel_group, []).append({
+                            "name": a.name,
+                            "type": "analyze",
+                            "prompt": f"Task: {a.name}",
+                            "model": a.model,
+                            "execute": True,
+                        })
+                for stage_tasks in stages.values():
+                    gemini_execution_results.extend(delegator.delegate_batch(
+                        stage_tasks, dry_run=False,
+                        concurrency=min(GEMINI_MAX_CONCURRENCY, len(stage_tasks)),
+                    ))
 
         anti_patterns = []
         if total_cost > budget:
@@ -279,6 +351,10 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
         if by_provider["gemini"] == 0 and any(t.get("requires_capability") in ("web_search", "code_execution") for t in tasks):
             anti_patterns.append("Capability-requiring tasks not routed to Gemini")
 
+        assignment_dicts = [
+            {name: getattr(a, name) for name in _ASSIGNMENT_FIELDS} for a in assignments
+        ]
+
         recommendations = [{
             "technique": "multi_model_orchestration",
             "applicable": True,
@@ -291,7 +367,7 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
             "all_opus_baseline_usd": round(all_opus_cost, 4),
             "savings_vs_opus": f"{savings:.0f}%",
             "within_budget": total_cost <= budget,
-            "assignments": [asdict(a) for a in assignments],
+            "assignments": assignment_dicts,
             "rules_applied": rules,
         }]
 
@@ -309,7 +385,7 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
         )
 
         analysis = {
-            "assignments": [asdict(a) for a in assignments],
+            "assignments": assignment_dicts,
             "costs": {"total": round(total_cost, 4), "claude": round(claude_cost, 4), "gemini": round(gemini_cost, 4)},
             "savings_vs_opus_pct": round(savings, 1),
             "parallel_stages": parallel_stages,
@@ -320,8 +396,7 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
             }),
         }
         if gemini_execution_results:
-            from dataclasses import asdict as _asdict
-            analysis["gemini_execution"] = [_asdict(r) for r in gemini_execution_results]
+            analysis["gemini_execution"] = [asdict(r) for r in gemini_execution_results]
 
         return AgentOutput(
             recommendations=recommendations,
@@ -332,6 +407,39 @@ class MultiModelOrchestratorAnalyzer(BaseAnalyzer):
             agent_metadata=self.build_metadata(),
         )
 
+    def _aggregate_costs(self, assignments: List[TaskAssignment]
+                         ) -> Tuple[float, float, float, float, Dict[str, int], Dict[str, int]]:
+        """Cost totals and distributions in one pass over the assignments.
+
+        Returns (total, claude, gemini, all_opus_baseline, by_provider, by_model).
+        Large plans run the numeric reductions through a numba kernel.
+        """
+        by_model = {}
+        for a in assignments:
+            by_model[a.model] = by_model.get(a.model, 0) + 1
+
+        if HAS_NUMBA and HAS_NUMPY and len(assignments) > NUMBA_MIN_TASKS:
+            n = len(assignments)
+            costs = np.fromiter((a.estimated_cost for a in assignments), dtype=np.float64, count=n)
+            is_gemini = np.fromiter((a.provider == "gemini" for a in assignments), dtype=np.bool_, count=n)
+            total, claude, gemini, baseline, n_gemini = _aggregate_costs_kernel(
+                costs, is_gemini, OPUS_BASELINE_TASK_COST,
+            )
+            by_provider = {"claude": n - int(n_gemini), "gemini": int(n_gemini)}
+            return float(total), float(claude), float(gemini), float(baseline), by_provider, by_model
+
+        total = claude = gemini = baseline = 0
+        by_provider = {"claude": 0, "gemini": 0}
+        for a in assignments:
+            total += a.estimated_cost
+            if a.provider == "claude":
+                claude += a.estimated_cost
+            else:
+                gemini += a.estimated_cost
+            baseline += OPUS_BASELINE_TASK_COST
+            by_provider[a.provider] += 1
+        return total, claude, gemini, baseline, by_provider, by_model
+
 
 if __name__ == "__main__":
     analyzer = MultiModelOrchestratorAnalyzer()
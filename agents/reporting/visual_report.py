@@ -16,7 +16,21 @@ Created: February 6, 2026
 
 import sys
 import os
+import re
 import json
+import math
+import pickle
+import shutil
+import heapq
+import hashlib
+import itertools
+import threading
+import importlib
+import importlib.util
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from shared.agent_base import (
@@ -24,11 +38,14 @@ from shared.agent_base import (
 )
 
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Lazy imports for visualization libraries
 _HAS_MATPLOTLIB = None
 _HAS_PILLOW = None
+_PLT = None
+_DEFAULT_RGB = None  # DEFAULT_COLORS as RGB tuples, parsed alongside the pyplot import
+_FIGURES = {}  # figsize -> (fig, ax) reused across standalone chart renders
 
 
 def _check_matplotlib():
@@ -43,22 +60,49 @@ def _check_matplotlib():
     return _HAS_MATPLOTLIB
 
 
+def _matplotlib_available() -> bool:
+    """Whether matplotlib is installed, without importing it (for dry runs)."""
+    if _HAS_MATPLOTLIB is not None:
+        return _HAS_MATPLOTLIB
+    return importlib.util.find_spec("matplotlib") is not None
+
+
+def _get_plt():
+    """matplotlib.pyplot on the Agg backend, imported on the first chart render."""
+    global _PLT, _DEFAULT_RGB
+    if _PLT is None:
+        import matplotlib.pyplot as plt
+        from matplotlib import colors as mcolors
+        _DEFAULT_RGB = [mcolors.to_rgb(c) for c in DEFAULT_COLORS]
+        _PLT = plt
+    return _PLT
+
+
 def _check_pillow():
+    # Pillow is only reported on, never used here: probe without importing it
     global _HAS_PILLOW
     if _HAS_PILLOW is None:
-        try:
-            from PIL import Image
-            _HAS_PILLOW = True
-        except ImportError:
-            _HAS_PILLOW = False
+        _HAS_PILLOW = importlib.util.find_spec("PIL") is not None
     return _HAS_PILLOW
 
 
+def __getattr__(name: str):
+    # PEP 562: capability flags and pyplot resolve on first access, so importing
+    # this module (e.g. for router introspection) never pays matplotlib's init
+    if name == "HAS_MATPLOTLIB":
+        return _matplotlib_available()
+    if name == "HAS_PILLOW":
+        return _check_pillow()
+    if name == "plt" and _check_matplotlib():
+        return _get_plt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ============================================================================
 # L1: Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ChartSpec:
     chart_type: str  # bar, pie, line, heatmap, table
     title: str
@@ -66,7 +110,7 @@ class ChartSpec:
     output_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportResult:
     charts_generated: int
     charts_failed: int
@@ -91,6 +135,304 @@ REPORT_DIR = os.path.join(
 )
 
 
+def _cycle_colors(n: int) -> List[Tuple[float, float, float]]:
+    """n pre-parsed palette colors, cycling DEFAULT_COLORS when there are more
+    series than colors (call after _get_plt())."""
+    if n <= len(_DEFAULT_RGB):
+        return _DEFAULT_RGB[:n]
+    return list(itertools.islice(itertools.cycle(_DEFAULT_RGB), n))
+
+
+# Reports with at least this many charts render them in a process pool, shared
+# across reports so worker start-up (and their matplotlib import) is paid once.
+# The pool has a fixed size and is never shut down under a report using it:
+# shutdown_render_pool() retires it, and the last report using it stops it.
+PARALLEL_MIN_CHARTS = 5
+RENDER_POOL_WORKERS = os.cpu_count() or 1
+# Workers import this module as reporting.visual_report (the agents dir is on
+# sys.path), so the pool also works when agent_sdk loads it from its file path
+RENDER_POOL_MODULE = "reporting.visual_report"
+_render_pool = None
+_render_pool_users = {}  # pool -> reports currently mapping over it
+_render_pool_lock = threading.Lock()
+
+# Rendered charts are cached under <output_dir>/.cache/<blake2b digest>.<format>,
+# keyed by spec, output settings, renderer version and matplotlib version. The
+# least recently used renders beyond CHART_CACHE_MAX_FILES are pruned; deleting
+# the directory clears the cache.
+CHART_CACHE_DIR = ".cache"
+CHART_CACHE_MAX_FILES = 256
+CHART_RENDERER_VERSION = 1  # bump when drawing or saving code changes the output
+
+# Output formats (workload["format"], workload["dpi"]); tradeoffs are reported
+# in agent_metadata["render"]
+OUTPUT_FORMATS = ("png", "svg")
+DEFAULT_DPI = 100
+PNG_COMPRESS_LEVEL = 1
+RENDER_TRADEOFF = (
+    "png: raster, render cost and file size grow with dpi^2; compress_level=1 "
+    "encodes fastest but files are ~40% larger than zlib's default. "
+    "svg: vector, no rasterization or dpi, size grows with the number of data points"
+)
+
+
+def _as_floats(seq):
+    """seq as a float ndarray (None -> nan), or None if it is not numeric."""
+    import numpy as np  # matplotlib's own dependency, loaded with it
+    try:
+        return np.asarray(seq, dtype=float)
+    except (TypeError, ValueError):
+        return None
+
+
+# Drawers validate data up front and return False (chart counted as failed)
+# rather than letting matplotlib raise from deep inside a draw call
+
+def _draw_bar_chart(spec: ChartSpec, ax) -> bool:
+    labels = list(spec.data.get("labels", []))
+    raw_values = spec.data.get("values", [])
+    values = _as_floats(raw_values)
+    # A single value is broadcast across every label, as ax.bar always did
+    if values is None or values.shape not in ((len(labels),), (1,)):
+        return False
+
+    bars = ax.bar(range(len(labels)), values, color=_cycle_colors(len(labels)))
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=45, ha="right", fontsize=9)
+    ax.set_title(spec.title, fontsize=14, fontweight="bold")
+    ax.set_ylabel("Value")
+
+    # Add value labels on bars in one call; broadcast bars past the first stay unlabeled
+    bar_values = [f"{val}" for val in raw_values][:len(labels)]
+    bar_values += [""] * (len(labels) - len(bar_values))
+    ax.bar_label(bars, labels=bar_values, fontsize=9)
+    return True
+
+
+def _draw_pie_chart(spec: ChartSpec, ax) -> bool:
+    labels = list(spec.data.get("labels", []))
+    values = _as_floats(spec.data.get("values", []))
+    if values is None or values.shape != (len(labels),):
+        return False
+
+    ax.pie(
+        values, labels=labels, colors=_cycle_colors(len(labels)),
+        autopct="%1.0f%%", startangle=90,
+    )
+    ax.set_aspect("equal")  # keep the pie round under constrained_layout
+    ax.set_title(spec.title, fontsize=14, fontweight="bold")
+    return True
+
+
+def _draw_line_chart(spec: ChartSpec, ax) -> bool:
+    import numpy as np
+
+    y = _as_floats(spec.data.get("y", []))
+    if y is None or y.ndim != 1:
+        return False
+    x = np.asarray(spec.data.get("x", range(len(y))))
+    if x.shape != y.shape:
+        return False
+
+    ax.plot(x, y, marker="o", color=_DEFAULT_RGB[0], linewidth=2)
+    ax.set_title(spec.title, fontsize=14, fontweight="bold")
+    ax.grid(True, alpha=0.3)
+    return True
+
+
+# Whitespace runs (tabs/newlines included) in a title become one "_" in file names
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# chart_type -> (drawer, standalone figsize)
+CHART_RENDERERS = {
+    "bar": (_draw_bar_chart, (10, 6)),
+    "pie": (_draw_pie_chart, (8, 8)),
+    "line": (_draw_line_chart, (10, 6)),
+}
+
+
+def _chart_path(spec: ChartSpec, output_dir: str, index: int, fmt: str = "png") -> str:
+    safe_title = _WHITESPACE_RE.sub("_", spec.title.lower())[:30]
+    return os.path.join(output_dir, f"chart_{index}_{safe_title}.{fmt}")
+
+
+def _save_figure(fig, path: str, fmt: str, dpi: int) -> None:
+    if fmt == "svg":
+        fig.savefig(path, format="svg")  # vector: nothing to rasterize, dpi unused
+    else:
+        fig.savefig(path, format="png", dpi=dpi, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
+
+
+def _render_on_axes(spec: ChartSpec, ax) -> bool:
+    """Draw spec onto an existing Axes; False if its chart type is unsupported."""
+    renderer = CHART_RENDERERS.get(spec.chart_type)
+    if renderer is None:
+        return False
+    return renderer[0](spec, ax)
+
+
+def _render_chart_file(spec: ChartSpec, output_path: str, fmt: str = "png",
+                       dpi: int = DEFAULT_DPI) -> bool:
+    """Render spec to its own file (module-level so pool workers can run it)."""
+    renderer = CHART_RENDERERS.get(spec.chart_type)
+    if renderer is None or not _check_matplotlib():
+        return False
+    plt = _get_plt()
+
+    # Identical specs render to identical files: reuse the cached render
+    draw, figsize = renderer
+    cache_dir = os.path.join(os.path.dirname(output_path), CHART_CACHE_DIR)
+    cache_path = os.path.join(cache_dir, f"{_spec_digest(spec, fmt, dpi, figsize)}.{fmt}")
+    if os.path.exists(cache_path):
+        try:
+            os.utime(cache_path)  # mark recently used for pruning
+            _place_file(cache_path, output_path)
+            return True
+        except FileNotFoundError:
+            pass  # pruned by a concurrent render: render it again
+
+    fig, ax = _reusable_figure(figsize)
+    if not draw(spec, ax):
+        return False
+
+    # Render to a fresh file and swap it in, so a path hardlinked into the
+    # cache is never rewritten in place
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    _save_figure(fig, tmp_path, fmt, dpi)
+    os.makedirs(cache_dir, exist_ok=True)
+    _place_file(tmp_path, cache_path)
+    os.replace(tmp_path, output_path)
+    _prune_chart_cache(cache_dir)
+    return True
+
+
+def _reusable_figure(figsize):
+    """Cleared (fig, ax) for figsize, kept open across charts in this process."""
+    entry = _FIGURES.get(figsize)
+    if entry is None:
+        # constrained_layout solves once per draw, replacing tight_layout()
+        # plus the second layout pass of savefig(bbox_inches="tight")
+        entry = _FIGURES[figsize] = _get_plt().subplots(figsize=figsize, layout="constrained")
+    else:
+        # Drop the previous chart's artists and data limits
+        # (clear() alone keeps the old dataLim)
+        entry[1].clear()
+        entry[1].relim()
+    return entry
+
+
+def close_figures() -> None:
+    """Release the figures kept open for reuse by chart rendering."""
+    if _FIGURES:
+        plt = _get_plt()
+        for fig, _ in _FIGURES.values():
+            plt.close(fig)
+        _FIGURES.clear()
+
+
+def _spec_digest(spec: ChartSpec, fmt: str, dpi: int, figsize: Tuple[float, float]) -> str:
+    """Cache key for a standalone render (call after _check_matplotlib())."""
+    key = json.dumps(
+        [CHART_RENDERER_VERSION, sys.modules["matplotlib"].__version__, PNG_COMPRESS_LEVEL,
+         spec.chart_type, spec.title, spec.data, fmt, dpi, list(figsize)],
+        sort_keys=True, default=str,
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _prune_chart_cache(cache_dir: str) -> None:
+    """Drop the least recently used renders beyond CHART_CACHE_MAX_FILES."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.stat().st_mtime_ns, e.path) for e in it
+                       if e.is_file() and not e.name.endswith(".link")]
+    except OSError:
+        return
+    for _, path in heapq.nsmallest(len(entries) - CHART_CACHE_MAX_FILES, entries):
+        try:
+            os.remove(path)  # hardlinked report files keep their own name
+        except OSError:
+            pass  # already pruned by a concurrent render
+
+
+_place_counter = itertools.count()
+
+
+def _place_file(src: str, dst: str) -> None:
+    """Atomically make dst a hardlink to (or, where links fail, a copy of) src."""
+    try:
+        if os.path.samefile(src, dst):
+            return  # already linked; rename() onto the same inode would be a no-op
+    except FileNotFoundError:
+        pass
+    tmp = f"{dst}.{os.getpid()}.{next(_place_counter)}.link"
+    try:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+
+
+def _render_mp_context():
+    # fork would copy the parent's threads and pyplot state into each worker
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+@contextmanager
+def _leased_render_pool():
+    """Yield the shared render pool, keeping it alive until the block exits."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=RENDER_POOL_WORKERS,
+                                               mp_context=_render_mp_context())
+        pool = _render_pool
+        _render_pool_users[pool] = _render_pool_users.get(pool, 0) + 1
+    try:
+        yield pool
+    finally:
+        with _render_pool_lock:
+            _render_pool_users[pool] -= 1
+            if not _render_pool_users[pool] and pool is not _render_pool:
+                del _render_pool_users[pool]
+                pool.shutdown(wait=False)
+
+
+def _retire_render_pool(pool=None) -> None:
+    """Detach the shared pool (only if it is still `pool`, when given) and stop
+    it once no report is using it."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None or pool not in (None, _render_pool):
+            return
+        retired, _render_pool = _render_pool, None
+        if not _render_pool_users.get(retired):
+            _render_pool_users.pop(retired, None)
+            retired.shutdown(wait=False)
+
+
+def shutdown_render_pool() -> None:
+    """Stop the shared render workers once idle; the next parallel report starts new ones."""
+    _retire_render_pool()
+
+
+def _render_pool_module():
+    """This module as workers will import it, or None if it is not importable."""
+    if __name__ == RENDER_POOL_MODULE:
+        return sys.modules[__name__]
+    try:
+        return importlib.import_module(RENDER_POOL_MODULE)
+    except ImportError:
+        return None
+
+
 # ============================================================================
 # L3: Analyzer
 # ============================================================================
@@ -152,95 +494,85 @@ class VisualReportAnalyzer(BaseAnalyzer):
             "generate_files": False,
         }
 
-    def _generate_bar_chart(self, spec: ChartSpec, output_path: str) -> bool:
-        """Generate a bar chart."""
-        if not _check_matplotlib():
-            return False
-        import matplotlib.pyplot as plt
-
-        labels = spec.data.get("labels", [])
-        values = spec.data.get("values", [])
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-        colors = DEFAULT_COLORS[:len(labels)]
-        bars = ax.bar(range(len(labels)), values, color=colors)
-        ax.set_xticks(range(len(labels)))
-        ax.set_xticklabels(labels, rotation=45, ha="right", fontsize=9)
-        ax.set_title(spec.title, fontsize=14, fontweight="bold")
-        ax.set_ylabel("Value")
-
-        # Add value labels on bars
-        for bar, val in zip(bars, values):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height(),
-                    f"{val}", ha="center", va="bottom", fontsize=9)
-
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close()
-        return True
-
-    def _generate_pie_chart(self, spec: ChartSpec, output_path: str) -> bool:
-        """Generate a pie chart."""
-        if not _check_matplotlib():
-            return False
-        import matplotlib.pyplot as plt
-
-        labels = spec.data.get("labels", [])
-        values = spec.data.get("values", [])
-
-        fig, ax = plt.subplots(figsize=(8, 8))
-        colors = DEFAULT_COLORS[:len(labels)]
-        wedges, texts, autotexts = ax.pie(
-            values, labels=labels, colors=colors,
-            autopct="%1.0f%%", startangle=90,
-        )
-        ax.set_title(spec.title, fontsize=14, fontweight="bold")
+    def close(self) -> None:
+        """Release the figures and render workers kept for reuse between reports."""
+        close_figures()
+        shutdown_render_pool()
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close()
-        return True
+    def _generate_chart(self, spec: ChartSpec, output_dir: str, index: int,
+                        fmt: str = "png", dpi: int = DEFAULT_DPI) -> Optional[str]:
+        """Generate a single chart and return path."""
+        output_path = _chart_path(spec, output_dir, index, fmt)
+        if _render_chart_file(spec, output_path, fmt, dpi):
+            return output_path
+        return None
 
-    def _generate_line_chart(self, spec: ChartSpec, output_path: str) -> bool:
-        """Generate a line chart."""
+    def _generate_charts(self, specs: List[ChartSpec], output_dir: str,
+                         fmt: str = "png", dpi: int = DEFAULT_DPI) -> List[Optional[str]]:
+        """Generate one file per spec (path or None on failure), in spec order.
+
+        Larger reports fan out over the shared process pool; each worker
+        imports matplotlib once and renders every chart it is handed.
+        """
+        module = None
+        if len(specs) >= PARALLEL_MIN_CHARTS and RENDER_POOL_WORKERS >= 2 and _check_matplotlib():
+            module = _render_pool_module()
+        if module is None:
+            return [self._generate_chart(spec, output_dir, i, fmt, dpi) for i, spec in enumerate(specs)]
+
+        paths = [_chart_path(spec, output_dir, i, fmt) for i, spec in enumerate(specs)]
+        if module.ChartSpec is not ChartSpec:
+            # Loaded from a file path: hand workers specs of the importable copy
+            specs = [module.ChartSpec(s.chart_type, s.title, s.data, s.output_path) for s in specs]
+        pool = None
+        try:
+            with _leased_render_pool() as pool:
+                ok = list(pool.map(module._render_chart_file, specs, paths,
+                                   itertools.repeat(fmt), itertools.repeat(dpi)))
+        except (OSError, ImportError, pickle.PicklingError, BrokenProcessPool):
+            # No usable multiprocessing here (e.g. no sem_open) or a worker died:
+            # retire the pool and render in-process
+            if pool is not None:
+                _retire_render_pool(pool)
+            return [self._generate_chart(spec, output_dir, i, fmt, dpi) for i, spec in enumerate(specs)]
+        return [path if rendered else None for path, rendered in zip(paths, ok)]
+
+    def _generate_combined(self, specs: List[ChartSpec], output_dir: str,
+                           fmt: str = "png", dpi: int = DEFAULT_DPI) -> Tuple[Optional[str], int]:
+        """Draw every spec onto one 2-column figure; return (path or None, failed count)."""
         if not _check_matplotlib():
-            return False
-        import matplotlib.pyplot as plt
-
-        x = spec.data.get("x", list(range(len(spec.data.get("y", [])))))
-        y = spec.data.get("y", [])
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.plot(x, y, marker="o", color=DEFAULT_COLORS[0], linewidth=2)
-        ax.set_title(spec.title, fontsize=14, fontweight="bold")
-        ax.grid(True, alpha=0.3)
-
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close()
-        return True
+            return None, len(specs)
+        plt = _get_plt()
 
-    def _generate_chart(self, spec: ChartSpec, output_dir: str, index: int) -> Optional[str]:
-        """Generate a single chart and return path."""
-        safe_title = spec.title.lower().replace(" ", "_")[:30]
-        output_path = os.path.join(output_dir, f"chart_{index}_{safe_title}.png")
-
-        generators = {
-            "bar": self._generate_bar_chart,
-            "pie": self._generate_pie_chart,
-            "line": self._generate_line_chart,
-        }
+        rows = max(1, math.ceil(len(specs) / 2))
+        fig, axes = plt.subplots(rows, 2, figsize=(20, 6 * rows), squeeze=False, layout="constrained")
+        failed = 0
+        for ax, spec in itertools.zip_longest(axes.flat, specs):
+            if spec is None or not _render_on_axes(spec, ax):
+                failed += spec is not None
+                ax.axis("off")
 
-        gen = generators.get(spec.chart_type)
-        if gen and gen(spec, output_path):
-            return output_path
-        return None
+        output_path = os.path.join(output_dir, f"combined_report.{fmt}")
+        _save_figure(fig, output_path, fmt, dpi)
+        plt.close(fig)
+        return (output_path if failed < len(specs) else None), failed
 
     def analyze(self, agent_input: AgentInput) -> AgentOutput:
         w = agent_input.workload
         charts_data = w.get("charts", [])
         output_dir = w.get("output_dir", REPORT_DIR)
         generate_files = w.get("generate_files", False)
+        combined = w.get("combined", False)  # all charts on one figure / file
+        fmt = str(w.get("format", "png")).lower()
+        unsupported_format = invalid_dpi = None
+        if fmt not in OUTPUT_FORMATS:
+            unsupported_format, fmt = fmt, "png"
+        try:
+            dpi = int(w.get("dpi", DEFAULT_DPI))
+        except (TypeError, ValueError, OverflowError):
+            dpi = 0
+        if dpi <= 0:
+            invalid_dpi, dpi = repr(w.get("dpi")), DEFAULT_DPI
 
         rules = [
             "report_001_chart_selection",
@@ -249,39 +581,58 @@ class VisualReportAnalyzer(BaseAnalyzer):
             "report_004_accessibility",
         ]
 
-        os.makedirs(output_dir, exist_ok=True)
-
         specs = []
-        for cd in charts_data:
-            specs.append(ChartSpec(
-                chart_type=cd.get("chart_type", "bar"),
-                title=cd.get("title", "Untitled"),
-                data=cd.get("data", {}),
-            ))
-
+        chart_specs = []
         generated = []
         failed = 0
         total_points = 0
 
-        for i, spec in enumerate(specs):
-            # Count data points
-            values = spec.data.get("values", spec.data.get("y", []))
-            rows = spec.data.get("rows", [])
-            total_points += len(values) + len(rows)
-
-            if generate_files:
-                path = self._generate_chart(spec, output_dir, i)
+        # One pass: build specs and count data points (the plotted series,
+        # else table rows, per chart; series plus rows in the total)
+        for cd in charts_data:
+            spec = ChartSpec(
+                chart_type=cd.get("chart_type", "bar"),
+                title=cd.get("title", "Untitled"),
+                data=cd.get("data", {}),
+            )
+            data = spec.data
+            series = data["values"] if "values" in data else data.get("y")
+            n_rows = len(data["rows"]) if "rows" in data else 0
+            n_series = len(series) if series is not None else 0
+            total_points += n_series + n_rows
+
+            specs.append(spec)
+            chart_specs.append({
+                "type": spec.chart_type,
+                "title": spec.title,
+                "data_points": n_series if series is not None else n_rows,
+            })
+
+        if not generate_files:
+            # Dry runs never build paths or touch output_dir
+            generated = [f"[dry run] {spec.chart_type}: {spec.title}" for spec in specs]
+        elif combined and specs:
+            os.makedirs(output_dir, exist_ok=True)
+            path, failed = self._generate_combined(specs, output_dir, fmt, dpi)
+            if path:
+                generated.append(path)
+        else:
+            os.makedirs(output_dir, exist_ok=True)
+            for path in self._generate_charts(specs, output_dir, fmt, dpi):
                 if path:
                     generated.append(path)
                 else:
                     failed += 1
-            else:
-                generated.append(f"[dry run] {spec.chart_type}: {spec.title}")
 
-        has_matplotlib = _check_matplotlib()
+        # Dry runs only report availability, so they never import matplotlib
+        has_matplotlib = _check_matplotlib() if generate_files else _matplotlib_available()
         has_pillow = _check_pillow()
 
         anti_patterns = []
+        if unsupported_format:
+            anti_patterns.append(f"Unsupported output format '{unsupported_format}' — rendered as png")
+        if invalid_dpi is not None:
+            anti_patterns.append(f"Invalid dpi {invalid_dpi} — rendered at {DEFAULT_DPI} dpi")
         if not has_matplotlib and generate_files:
             anti_patterns.append("matplotlib not installed — charts cannot be generated")
         if failed > 0:
@@ -294,14 +645,13 @@ class VisualReportAnalyzer(BaseAnalyzer):
             total_data_points=total_points,
         )
 
+        report_dict = asdict(report)
+
         recommendations = [{
             "technique": "visual_report",
             "applicable": True,
-            "report": asdict(report),
-            "chart_specs": [
-                {"type": s.chart_type, "title": s.title, "data_points": len(s.data.get("values", s.data.get("y", s.data.get("rows", []))))}
-                for s in specs
-            ],
+            "report": report_dict,
+            "chart_specs": chart_specs,
             "libraries": {"matplotlib": has_matplotlib, "pillow": has_pillow},
             "rules_applied": rules,
         }]
@@ -317,11 +667,14 @@ class VisualReportAnalyzer(BaseAnalyzer):
             rules_applied=rules,
             meta_insight=meta_insight,
             analysis_data={
-                "report": asdict(report),
+                "report": report_dict,
                 "output_dir": output_dir,
             },
             anti_patterns=anti_patterns,
-            agent_metadata=self.build_metadata(),
+            agent_metadata={
+                **self.build_metadata(),
+                "render": {"format": fmt, "dpi": dpi if fmt == "png" else None, "tradeoff": RENDER_TRADEOFF},
+            },
         )
 
 
@@ -17,6 +17,7 @@ Created: February 6, 2026
 
 import sys
 import os
+import heapq
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from shared.agent_base import (
@@ -24,14 +25,33 @@ from shared.agent_base import (
 )
 
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 
 # ============================================================================
 # L1: Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RouteDecision:
     task: str
     primary_agent: str
@@ -127,6 +147,179 @@ INTENT_KEYWORDS = {
     "expand": ["expansion", "creative", "visionary"],
 }
 
+# Scoring tables derived once at import (registry and keywords are static).
+# Patterns are lowercased here so matching against task.lower() needs no
+# per-task case handling
+_AGENT_CAPS_FROZEN = {
+    aid: frozenset(info["capabilities"]) for aid, info in AGENT_REGISTRY.items()
+}
+_AGENT_CAP_PHRASES = {
+    aid: tuple(c.replace("_", " ").lower() for c in caps) for aid, caps in _AGENT_CAPS_FROZEN.items()
+}
+_INTENT_ITEMS = [(kw.lower(), frozenset(caps)) for kw, caps in INTENT_KEYWORDS.items()]
+
+# Inverted indexes: the points a matched keyword / capability phrase gives each agent
+_KW_AGENT_POINTS = {
+    kw: tuple(
+        (aid, len(caps & relevant) * 10.0)
+        for aid, caps in _AGENT_CAPS_FROZEN.items() if caps & relevant
+    )
+    for kw, relevant in _INTENT_ITEMS
+}
+_PHRASE_TO_AGENTS: Dict[str, set] = {}
+for _aid, _phrases in _AGENT_CAP_PHRASES.items():
+    for _phrase in _phrases:
+        _PHRASE_TO_AGENTS.setdefault(_phrase, set()).add(_aid)
+_KEYWORD_PATTERNS = tuple(_KW_AGENT_POINTS)
+_PHRASE_PATTERNS = tuple(_PHRASE_TO_AGENTS)
+_AGENT_POSITION = {aid: i for i, aid in enumerate(AGENT_REGISTRY)}
+_AGENT_IDS = tuple(AGENT_REGISTRY)
+
+# Below this many distinct tasks per batch, per-task dict scoring beats the matrix setup
+VECTORIZE_MIN_TASKS = 64
+# From this many distinct tasks the numba kernel replaces the dense matrix product
+NUMBA_MIN_TASKS = 1000
+# Memoized rankings per lowercased task (batch jobs resubmit the same tasks)
+ROUTE_CACHE_SIZE = 1024
+
+if HAS_NUMPY:
+    # Pattern x agent points matrix (columns in registry order): a task's
+    # matched-pattern indicator row times it gives every agent's score
+    _KW_COL = {kw: i for i, kw in enumerate(_KEYWORD_PATTERNS)}
+    _PHRASE_COL = {phrase: len(_KW_COL) + i for i, phrase in enumerate(_PHRASE_PATTERNS)}
+    _AGENT_COL = {aid: i for i, aid in enumerate(_AGENT_IDS)}
+    _PATTERN_POINTS = np.zeros((len(_KW_COL) + len(_PHRASE_COL), len(_AGENT_IDS)), dtype=np.float64)
+    for _kw, _points in _KW_AGENT_POINTS.items():
+        for _aid, _pts in _points:
+            _PATTERN_POINTS[_KW_COL[_kw], _AGENT_COL[_aid]] = _pts
+    for _phrase, _aids in _PHRASE_TO_AGENTS.items():
+        for _aid in _aids:
+            _PATTERN_POINTS[_PHRASE_COL[_phrase], _AGENT_COL[_aid]] = 5.0
+
+if HAS_NUMBA and HAS_NUMPY:
+    @numba.njit(cache=True)
+    def _top_scores_kernel(row_ptr, pattern_rows, pattern_points, limit):
+        """Per task, sum the _PATTERN_POINTS rows it matched (CSR: row_ptr /
+        pattern_rows) and keep the best `limit` positive-scoring agent columns.
+
+        Ties go to the lower column, matching the stable argsort of the
+        matrix path; unfilled slots keep column -1.
+        """
+        n_tasks = row_ptr.shape[0] - 1
+        n_agents = pattern_points.shape[1]
+        top_cols = np.full((n_tasks, limit), -1, dtype=np.int64)
+        top_scores = np.zeros((n_tasks, limit), dtype=np.float64)
+        scores = np.empty(n_agents, dtype=np.float64)
+        for t in range(n_tasks):
+            scores[:] = 0.0
+            for k in range(row_ptr[t], row_ptr[t + 1]):
+                pattern = pattern_rows[k]
+                for j in range(n_agents):
+                    scores[j] += pattern_points[pattern, j]
+            for j in range(n_agents):
+                score = scores[j]
+                if score <= top_scores[t, limit - 1]:
+                    continue
+                pos = limit - 1
+                while pos > 0 and top_scores[t, pos - 1] < score:
+                    top_scores[t, pos] = top_scores[t, pos - 1]
+                    top_cols[t, pos] = top_cols[t, pos - 1]
+                    pos -= 1
+                top_scores[t, pos] = score
+                top_cols[t, pos] = j
+        return top_cols, top_scores
+
+_pattern_automaton = None
+
+
+def _match_patterns(task_lower: str) -> Tuple[set, set]:
+    """(intent keywords, capability phrases) occurring in a lowercased task.
+
+    One Aho-Corasick pass over the task when pyahocorasick is installed,
+    else a substring probe per pattern.
+    """
+    global _pattern_automaton
+    if HAS_AHOCORASICK:
+        if _pattern_automaton is None:
+            _pattern_automaton = ahocorasick.Automaton()
+            for pattern in set(_KEYWORD_PATTERNS) | set(_PHRASE_PATTERNS):
+                _pattern_automaton.add_word(
+                    pattern, (pattern, pattern in _KW_AGENT_POINTS, pattern in _PHRASE_TO_AGENTS),
+                )
+            _pattern_automaton.make_automaton()
+        keywords, phrases = set(), set()
+        for _, (pattern, is_keyword, is_phrase) in _pattern_automaton.iter(task_lower):
+            if is_keyword:
+                keywords.add(pattern)
+            if is_phrase:
+                phrases.add(pattern)
+        return keywords, phrases
+    return (
+        {kw for kw in _KEYWORD_PATTERNS if kw in task_lower},
+        {phrase for phrase in _PHRASE_PATTERNS if phrase in task_lower},
+    )
+
+
+def _rank_agents(keywords: set, phrases: set, limit: int = 3) -> List[Tuple[int, float]]:
+    """Top-`limit` (agent_id, score) among agents with a positive score, best first.
+
+    10 points per capability an agent shares with a matched keyword, plus
+    5 per capability phrase found in the task; ties keep registry order.
+    """
+    agent_scores: Dict[int, float] = {}
+    for keyword in keywords:
+        for agent_id, points in _KW_AGENT_POINTS[keyword]:
+            agent_scores[agent_id] = agent_scores.get(agent_id, 0.0) + points
+    for phrase in phrases:
+        for agent_id in _PHRASE_TO_AGENTS[phrase]:
+            agent_scores[agent_id] = agent_scores.get(agent_id, 0.0) + 5.0
+    return heapq.nlargest(
+        limit, agent_scores.items(), key=lambda x: (x[1], -_AGENT_POSITION[x[0]]),
+    )
+
+
+@lru_cache(maxsize=ROUTE_CACHE_SIZE)
+def _rank_task(task_lower: str) -> Tuple[Tuple[int, float], ...]:
+    """Top-3 (agent_id, score) ranking for a lowercased task, memoized."""
+    return tuple(_rank_agents(*_match_patterns(task_lower)))
+
+
+def _rank_agents_batch(matches: List[Tuple[set, set]], limit: int = 3) -> List[List[Tuple[int, float]]]:
+    """Top-`limit` _rank_agents results for many tasks from one matrix product
+    (or, for very large batches, one numba pass over the matched patterns)."""
+    if HAS_NUMBA and len(matches) >= NUMBA_MIN_TASKS:
+        row_ptr, pattern_rows = [0], []
+        for keywords, phrases in matches:
+            pattern_rows.extend(_KW_COL[keyword] for keyword in keywords)
+            pattern_rows.extend(_PHRASE_COL[phrase] for phrase in phrases)
+            row_ptr.append(len(pattern_rows))
+        top_cols, top_scores = _top_scores_kernel(
+            np.array(row_ptr, dtype=np.int64), np.array(pattern_rows, dtype=np.int64),
+            _PATTERN_POINTS, limit,
+        )
+        return [
+            [(_AGENT_IDS[col], score) for col, score in zip(agent_cols, scores) if col >= 0]
+            for agent_cols, scores in zip(top_cols.tolist(), top_scores.tolist())
+        ]
+
+    rows, cols = [], []
+    for row, (keywords, phrases) in enumerate(matches):
+        for keyword in keywords:
+            rows.append(row)
+            cols.append(_KW_COL[keyword])
+        for phrase in phrases:
+            rows.append(row)
+            cols.append(_PHRASE_COL[phrase])
+    matched = np.zeros((len(matches), _PATTERN_POINTS.shape[0]), dtype=np.float64)
+    matched[rows, cols] = 1.0
+    scores = matched @ _PATTERN_POINTS  # tasks x agents; integer-valued, so exact
+    order = np.argsort(-scores, axis=1, kind="stable")[:, :limit]
+    top = np.take_along_axis(scores, order, axis=1)
+    return [
+        [(_AGENT_IDS[col], score) for col, score in zip(agent_cols, top_scores) if score > 0]
+        for agent_cols, top_scores in zip(order.tolist(), top.tolist())
+    ]
+
 
 # ============================================================================
 # L3: Analyzer
@@ -156,35 +349,22 @@ class AgenticToolRouterAnalyzer(BaseAnalyzer):
             ],
         }
 
-    def _score_agent(self, task_lower: str, agent_id: int, agent_info: Dict) -> float:
-        """Score an agent's relevance to a task based on keyword matching."""
-        score = 0.0
-        capabilities = set(agent_info["capabilities"])
-
-        for keyword, relevant_caps in INTENT_KEYWORDS.items():
-            if keyword in task_lower:
-                matching = capabilities.intersection(relevant_caps)
-                score += len(matching) * 10.0
-
-        # Bonus for exact capability word matches
-        for cap in capabilities:
-            if cap.replace("_", " ") in task_lower:
-                score += 5.0
-
-        return score
-
     def _route_task(self, task: str) -> RouteDecision:
         """Route a single task to the best agent."""
-        task_lower = task.lower()
+        return self._decide(task, _rank_task(task.lower()))
 
-        # Score all agents
-        scores = []
-        for agent_id, info in AGENT_REGISTRY.items():
-            score = self._score_agent(task_lower, agent_id, info)
-            if score > 0:
-                scores.append((agent_id, info, score))
+    def _route_batch(self, tasks: List[str]) -> List[RouteDecision]:
+        """Route many tasks; large batches score all distinct tasks in one matrix product."""
+        lowered = [task.lower() for task in tasks]
+        distinct = list(dict.fromkeys(lowered))
+        if not HAS_NUMPY or len(distinct) < VECTORIZE_MIN_TASKS:
+            return [self._decide(task, _rank_task(low)) for task, low in zip(tasks, lowered)]
+        ranked = dict(zip(distinct, _rank_agents_batch([_match_patterns(low) for low in distinct])))
+        return [self._decide(task, ranked[low]) for task, low in zip(tasks, lowered)]
 
-        scores.sort(key=lambda x: x[2], reverse=True)
+    def _decide(self, task: str, ranked: List[Tuple[int, float]]) -> RouteDecision:
+        """RouteDecision from ranked (agent_id, score) pairs, best first."""
+        scores = [(agent_id, AGENT_REGISTRY[agent_id], score) for agent_id, score in ranked[:3]]
 
         if not scores:
             # Default to intent-engine for unmatched tasks
@@ -229,7 +409,7 @@ class AgenticToolRouterAnalyzer(BaseAnalyzer):
             "route_004_cost_estimation",
         ]
 
-        decisions = [self._route_task(task) for task in tasks]
+        decisions = self._route_batch(tasks)
 
         total_cost = sum(d.estimated_cost_usd for d in decisions)
         avg_confidence = sum(d.confidence for d in decisions) / max(1, len(decisions))
@@ -251,6 +431,8 @@ class AgenticToolRouterAnalyzer(BaseAnalyzer):
                 f"{len(low_conf)} tasks routed with low confidence (<0.5)"
             )
 
+        routes = [asdict(d) for d in decisions]
+
         recommendations = [{
             "technique": "agentic_routing",
             "applicable": True,
@@ -259,11 +441,11 @@ class AgenticToolRouterAnalyzer(BaseAnalyzer):
             "total_estimated_cost_usd": round(total_cost, 4),
             "agent_utilization": agent_usage,
             "tier_distribution": tier_dist,
-            "routes": [asdict(d) for d in decisions],
+            "routes": routes,
             "rules_applied": rules,
         }]
 
-        top_agents = sorted(agent_usage.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_agents = heapq.nlargest(3, agent_usage.items(), key=lambda x: x[1])
         meta_insight = (
             f"Routed {len(decisions)} tasks across {len(agent_usage)} agents. "
             f"Avg confidence: {avg_confidence:.2f}. Est. cost: ${total_cost:.3f}. "
@@ -275,7 +457,7 @@ class AgenticToolRouterAnalyzer(BaseAnalyzer):
             rules_applied=rules,
             meta_insight=meta_insight,
             analysis_data={
-                "routes": [asdict(d) for d in decisions],
+                "routes": routes,
                 "agent_utilization": agent_usage,
                 "tier_distribution": tier_dist,
                 "total_agents_in_registry": len(AGENT_REGISTRY),
@@ -16,6 +16,7 @@ Created: February 6, 2026
 
 import sys
 import os
+import marshal
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from shared.agent_base import (
@@ -30,9 +31,12 @@ try:
 except ImportError:
     ENGINE_AVAILABLE = False
 
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from pathlib import Path
+from operator import attrgetter
+from types import MappingProxyType
 import json
 
 
@@ -40,7 +44,7 @@ import json
 # L1: Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     rule_id: str
     title: str
@@ -50,6 +54,24 @@ class Violation:
     correct_approach: str
     recovery_steps: List[str]
     matched_features: List[str]
+    # SEVERITY_ORDER rank, fixed at construction so sorting is an attribute fetch
+    severity_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.severity_rank = SEVERITY_ORDER.get(self.severity, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """asdict() equivalent; fields are flat, so only the lists need copying."""
+        return {
+            "rule_id": self.rule_id,
+            "title": self.title,
+            "severity": self.severity,
+            "description": self.description,
+            "why_it_fails": self.why_it_fails,
+            "correct_approach": self.correct_approach,
+            "recovery_steps": list(self.recovery_steps),
+            "matched_features": list(self.matched_features),
+        }
 
 
 # ============================================================================
@@ -68,7 +90,131 @@ FEATURE_PATTERNS = {
     "multi_model": ["multi_model", "cascade", "delegation"],
 }
 
-SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+SEVERITY_ORDER = MappingProxyType({"critical": 0, "high": 1, "medium": 2, "low": 3})
+
+
+# Most-recent workloads whose AgentOutput each validator keeps (IDE tooling
+# re-runs the same pre-flight on every keystroke)
+ANALYZE_CACHE_SIZE = 128
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for a JSON-like workload value.
+
+    Every value is tagged with its type, so values that compare equal across
+    types (1, True, 1.0) give distinct keys.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in sorted(value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _workload_key(features: List[str], context: Dict[str, Any]) -> Optional[Tuple]:
+    """Cache key for analyze(), or None if the workload is not hashable."""
+    try:
+        key = (_freeze(features), _freeze(context))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Rule-id markers the heuristics dedupe against: id prefixes and id substrings
+DEDUPE_PREFIXES = ("anti_001",)
+DEDUPE_TAGS = ("loop", "iteration")
+
+
+def _rule_markers(rule_id: str) -> set:
+    """DEDUPE_PREFIXES the rule id starts with plus DEDUPE_TAGS it contains."""
+    markers = {prefix for prefix in DEDUPE_PREFIXES if rule_id.startswith(prefix)}
+    markers.update(tag for tag in DEDUPE_TAGS if tag in rule_id)
+    return markers
+
+
+# Heuristic checks supplementing the rule engine. Each takes (feature set,
+# context, markers of the violations so far) and returns a Violation or None.
+
+def _heuristic_batch_realtime(features: frozenset, context: Dict[str, Any],
+                              seen: set) -> Optional[Violation]:
+    if not ("real_time" in features or context.get("latency_sensitive")):
+        return None
+    if "anti_001" in seen:
+        return None
+    return Violation(
+        rule_id="heuristic_001_batch_realtime",
+        title="Batch API with real-time requirement",
+        severity="critical",
+        description="Batch API adds 1-24h latency, incompatible with real-time",
+        why_it_fails="Batch API is asynchronous by design",
+        correct_approach="Use synchronous API for real-time, batch for async only",
+        recovery_steps=["Remove batch_api from real-time path", "Add async/sync routing"],
+        matched_features=["batch_api", "real_time"],
+    )
+
+
+def _heuristic_unbounded_loops(features: frozenset, context: Dict[str, Any],
+                               seen: set) -> Optional[Violation]:
+    if context.get("max_iterations"):
+        return None
+    if "loop" in seen or "iteration" in seen:
+        return None
+    return Violation(
+        rule_id="heuristic_002_unbounded_loops",
+        title="Tool loops without max_iterations",
+        severity="critical",
+        description="Unbounded loops can run forever, consuming unlimited tokens",
+        why_it_fails="No termination condition leads to runaway costs",
+        correct_approach="Always set max_iterations (recommended: 3-10)",
+        recovery_steps=["Add max_iterations parameter", "Add cost circuit breaker"],
+        matched_features=["tool_loops"],
+    )
+
+
+def _heuristic_no_error_handling(features: frozenset, context: Dict[str, Any],
+                                 seen: set) -> Optional[Violation]:
+    if context.get("error_handling") not in ("none", None, ""):
+        return None
+    return Violation(
+        rule_id="heuristic_003_no_error_handling",
+        title="No error handling strategy",
+        severity="high",
+        description="Tools without error handling fail silently",
+        why_it_fails="Silent failures cascade and corrupt downstream results",
+        correct_approach="Implement retry, fallback, or abort strategy",
+        recovery_steps=["Add try/except blocks", "Define fallback behavior", "Add logging"],
+        matched_features=["error_handling"],
+    )
+
+
+def _heuristic_unconstrained_thinking(features: frozenset, context: Dict[str, Any],
+                                      seen: set) -> Optional[Violation]:
+    if context.get("thinking_budget"):
+        return None
+    return Violation(
+        rule_id="heuristic_004_unconstrained_thinking",
+        title="Extended thinking without budget",
+        severity="high",
+        description="Unconstrained thinking can consume excessive tokens (plateau at 8K)",
+        why_it_fails="Diminishing returns above 8,000 thinking tokens",
+        correct_approach="Set explicit thinking budget based on complexity",
+        recovery_steps=["Set thinking_budget to 8000 max", "Use Thinking Budget Optimizer agent"],
+        matched_features=["extended_thinking"],
+    )
+
+
+# Heuristics indexed by the feature that must be present for them to fire
+# (ALWAYS_TRIGGER: context-only checks); insertion order is evaluation order
+ALWAYS_TRIGGER = "__always__"
+HEURISTIC_INDEX: Dict[str, List[Callable[[frozenset, Dict[str, Any], set], Optional[Violation]]]] = {
+    "batch_api": [_heuristic_batch_realtime],
+    "tool_loops": [_heuristic_unbounded_loops],
+    ALWAYS_TRIGGER: [_heuristic_no_error_handling],
+    "extended_thinking": [_heuristic_unconstrained_thinking],
+}
 
 
 # ============================================================================
@@ -78,6 +224,10 @@ SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 class AntiPatternValidatorAnalyzer(BaseAnalyzer):
     """Anti-pattern pre-flight validation engine."""
 
+    # (loaded RuleEngine, anti-pattern category key) per rules directory,
+    # shared by every analyzer instance
+    _engine_cache: Dict[str, Any] = {}
+
     def __init__(self):
         super().__init__(
             agent_name="anti-pattern-validator",
@@ -86,22 +236,33 @@ class AntiPatternValidatorAnalyzer(BaseAnalyzer):
         )
         self.engine = None
         self.anti_patterns = []
+        self._anti_patterns_loaded = False
+        self._anti_cat_key = None  # engine category holding anti-pattern rules
+        self._analyze_cache: OrderedDict = OrderedDict()  # workload key -> marshalled AgentOutput fields
         if ENGINE_AVAILABLE:
-            self.engine = RuleEngine(rules_dir=Path(SYNTHESIS_RULES_DIR))
+            self.engine, self._anti_cat_key = self._shared_engine()
+
+    @classmethod
+    def _shared_engine(cls):
+        """Process-wide RuleEngine for SYNTHESIS_RULES_DIR and its anti-pattern category."""
+        key = str(SYNTHESIS_RULES_DIR)
+        cached = cls._engine_cache.get(key)
+        if cached is None:
+            engine = RuleEngine(rules_dir=Path(SYNTHESIS_RULES_DIR))
+            engine.load_rules()
+            cat_key = next(
+                (k for k in engine.rules_by_category if "anti" in str(k).lower()), None
+            )
+            cached = cls._engine_cache[key] = (engine, cat_key)
+        return cached
 
     def _load_anti_patterns(self):
-        """Load all anti-pattern rules."""
-        if not self.engine:
+        """Load all anti-pattern rules (once; clear _anti_patterns_loaded to reload)."""
+        if not self.engine or self._anti_patterns_loaded:
             return
-        if not self.engine.loaded:
-            self.engine.load_rules()
-        cat_key = None
-        for k in self.engine.rules_by_category:
-            if "anti" in str(k).lower():
-                cat_key = k
-                break
-        if cat_key:
-            self.anti_patterns = self.engine.rules_by_category[cat_key]
+        if self._anti_cat_key:
+            self.anti_patterns = self.engine.rules_by_category[self._anti_cat_key]
+        self._anti_patterns_loaded = True
 
     def get_example_input(self) -> Dict[str, Any]:
         return {
@@ -125,6 +286,15 @@ class AntiPatternValidatorAnalyzer(BaseAnalyzer):
         context = w.get("context", {})
         description = w.get("workflow_description", "")
 
+        # Identical workloads reuse the last result. Entries are marshalled
+        # bytes, so each hit unpacks a private copy (no caller can mutate the
+        # entry) for a fraction of a deepcopy; metadata is always fresh
+        cache_key = _workload_key(features, context)
+        cached = self._analyze_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            self._analyze_cache.move_to_end(cache_key)
+            return AgentOutput(*marshal.loads(cached), agent_metadata=self.build_metadata())
+
         rules_applied = [
             "validate_001_anti_pattern_scan",
             "validate_002_severity_classification",
@@ -134,9 +304,10 @@ class AntiPatternValidatorAnalyzer(BaseAnalyzer):
         self._load_anti_patterns()
 
         violations = []
+        feature_set = frozenset(features)  # O(1) trigger checks; engine keeps the list
 
-        # Rule engine validation
-        if self.engine:
+        # Rule engine validation (anti-pattern rules need at least one input feature)
+        if self.engine and feature_set:
             result = self.engine.validate_combination(features, context)
             if not result.valid:
                 for mr in result.matched_rules:
@@ -153,83 +324,46 @@ class AntiPatternValidatorAnalyzer(BaseAnalyzer):
                         matched_features=mr.get("predicate", {}).get("inputs", []),
                     ))
 
-        # Heuristic checks (supplement rule engine)
-        if "batch_api" in features and ("real_time" in features or context.get("latency_sensitive")):
-            if not any(v.rule_id.startswith("anti_001") for v in violations):
-                violations.append(Violation(
-                    rule_id="heuristic_001_batch_realtime",
-                    title="Batch API with real-time requirement",
-                    severity="critical",
-                    description="Batch API adds 1-24h latency, incompatible with real-time",
-                    why_it_fails="Batch API is asynchronous by design",
-                    correct_approach="Use synchronous API for real-time, batch for async only",
-                    recovery_steps=["Remove batch_api from real-time path", "Add async/sync routing"],
-                    matched_features=["batch_api", "real_time"],
-                ))
-
-        if "tool_loops" in features and not context.get("max_iterations"):
-            if not any("loop" in v.rule_id or "iteration" in v.rule_id for v in violations):
-                violations.append(Violation(
-                    rule_id="heuristic_002_unbounded_loops",
-                    title="Tool loops without max_iterations",
-                    severity="critical",
-                    description="Unbounded loops can run forever, consuming unlimited tokens",
-                    why_it_fails="No termination condition leads to runaway costs",
-                    correct_approach="Always set max_iterations (recommended: 3-10)",
-                    recovery_steps=["Add max_iterations parameter", "Add cost circuit breaker"],
-                    matched_features=["tool_loops"],
-                ))
-
-        if context.get("error_handling") in ("none", None, ""):
-            violations.append(Violation(
-                rule_id="heuristic_003_no_error_handling",
-                title="No error handling strategy",
-                severity="high",
-                description="Tools without error handling fail silently",
-                why_it_fails="Silent failures cascade and corrupt downstream results",
-                correct_approach="Implement retry, fallback, or abort strategy",
-                recovery_steps=["Add try/except blocks", "Define fallback behavior", "Add logging"],
-                matched_features=["error_handling"],
-            ))
-
-        if "extended_thinking" in features and not context.get("thinking_budget"):
-            violations.append(Violation(
-                rule_id="heuristic_004_unconstrained_thinking",
-                title="Extended thinking without budget",
-                severity="high",
-                description="Unconstrained thinking can consume excessive tokens (plateau at 8K)",
-                why_it_fails="Diminishing returns above 8,000 thinking tokens",
-                correct_approach="Set explicit thinking budget based on complexity",
-                recovery_steps=["Set thinking_budget to 8000 max", "Use Thinking Budget Optimizer agent"],
-                matched_features=["extended_thinking"],
-            ))
+        # Heuristic checks (supplement rule engine): only those whose
+        # trigger feature is present run, in HEURISTIC_INDEX order
+        seen = set()
+        for v in violations:
+            seen |= _rule_markers(v.rule_id)
+        for trigger, heuristics in HEURISTIC_INDEX.items():
+            if trigger != ALWAYS_TRIGGER and trigger not in feature_set:
+                continue
+            for heuristic in heuristics:
+                violation = heuristic(feature_set, context, seen)
+                if violation:
+                    violations.append(violation)
+                    seen |= _rule_markers(violation.rule_id)
 
         # Sort by severity
-        violations.sort(key=lambda v: SEVERITY_ORDER.get(v.severity, 3))
+        violations.sort(key=attrgetter("severity_rank"))
 
-        # Build output
-        by_severity = {}
+        # Build output: severity counts and critical/high summaries in one pass
+        by_severity: Dict[str, int] = {}
+        anti_patterns_out = []
         for v in violations:
-            by_severity.setdefault(v.severity, []).append(v)
+            by_severity[v.severity] = by_severity.get(v.severity, 0) + 1
+            if v.severity in ("critical", "high"):
+                anti_patterns_out.append(f"{v.severity.upper()}: [{v.rule_id}] {v.title}")
+
+        violation_dicts = [v.to_dict() for v in violations]
 
         recommendations = [{
             "technique": "anti_pattern_validation",
             "applicable": True,
             "total_violations": len(violations),
-            "by_severity": {k: len(v) for k, v in by_severity.items()},
-            "violations": [asdict(v) for v in violations],
+            "by_severity": dict(by_severity),
+            "violations": violation_dicts,
             "engine_rules_loaded": len(self.anti_patterns),
             "pass": len(violations) == 0,
             "rules_applied": rules_applied,
         }]
 
-        anti_patterns_out = [
-            f"{v.severity.upper()}: [{v.rule_id}] {v.title}"
-            for v in violations if v.severity in ("critical", "high")
-        ]
-
-        critical = len(by_severity.get("critical", []))
-        high = len(by_severity.get("high", []))
+        critical = by_severity.get("critical", 0)
+        high = by_severity.get("high", 0)
 
         if violations:
             meta_insight = (
@@ -240,19 +374,30 @@ class AntiPatternValidatorAnalyzer(BaseAnalyzer):
         else:
             meta_insight = "Pre-flight PASSED: No anti-patterns detected."
 
-        return AgentOutput(
+        output = AgentOutput(
             recommendations=recommendations,
             rules_applied=rules_applied,
             meta_insight=meta_insight,
             analysis_data={
-                "violations": [asdict(v) for v in violations],
-                "by_severity": {k: len(v) for k, v in by_severity.items()},
-                "features_checked": features,
+                "violations": violation_dicts,
+                "by_severity": by_severity,
+                "features_checked": list(features),
                 "pass": len(violations) == 0,
             },
             anti_patterns=anti_patterns_out,
             agent_metadata=self.build_metadata(),
         )
+        if cache_key is not None:
+            try:
+                self._analyze_cache[cache_key] = marshal.dumps((
+                    output.recommendations, output.rules_applied, output.meta_insight,
+                    output.analysis_data, output.anti_patterns,
+                ))
+            except ValueError:
+                pass  # a rule or feature value marshal cannot encode: leave uncached
+            while len(self._analyze_cache) > ANALYZE_CACHE_SIZE:
+                self._analyze_cache.popitem(last=False)
+        return output
 
 
 if __name__ == "__main__":
@@ -19,6 +19,9 @@ Updated: February 6, 2026 (v1.1 - custom .pb files integration)
 import sys
 import os
 import re
+import json
+import hashlib
+from functools import lru_cache
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from shared.agent_base import (
@@ -34,16 +37,29 @@ try:
 except ImportError:
     ENGINE_AVAILABLE = False
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 
 # ============================================================================
 # L1: Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PlaybookMatch:
     name: str
     topic: str
@@ -54,6 +70,19 @@ class PlaybookMatch:
     file_path: str = ""
     category: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """asdict() equivalent without the recursive walk; key_rules entries are flat."""
+        return {
+            "name": self.name,
+            "topic": self.topic,
+            "relevance_score": self.relevance_score,
+            "matched_keywords": list(self.matched_keywords),
+            "key_rules": [dict(r) for r in self.key_rules],
+            "rule_count": self.rule_count,
+            "file_path": self.file_path,
+            "category": self.category,
+        }
+
 
 # ============================================================================
 # L2: Constants
@@ -398,6 +427,224 @@ VARIANT_CATALOG = {
     },
 }
 
+# Read-only views: the keyword index below is derived from these at import
+PLAYBOOK_CATALOG = MappingProxyType(PLAYBOOK_CATALOG)
+VARIANT_CATALOG = MappingProxyType(VARIANT_CATALOG)
+
+
+def _normalize_keywords(catalog: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Catalog whose keywords are lowercase and distinct (task text is matched
+    lowercased); entries are copied only when that changes them."""
+    normalized = {}
+    for name, info in catalog.items():
+        keywords = tuple(dict.fromkeys(kw.lower() for kw in info["keywords"]))
+        if list(keywords) != list(info["keywords"]):
+            info = {**info, "keywords": keywords}
+        normalized[name] = info
+    return normalized
+
+
+_STATIC_CATALOG = _normalize_keywords({**PLAYBOOK_CATALOG, **VARIANT_CATALOG})
+
+
+def _index_keywords(catalog: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """keyword -> playbooks listing it, in catalog order."""
+    index: Dict[str, List[str]] = {}
+    for pb_name, pb_info in catalog.items():
+        for kw in pb_info["keywords"]:
+            names = index.setdefault(kw, [])
+            if not names or names[-1] != pb_name:
+                names.append(pb_name)
+    return index
+
+
+# Inverted keyword index over the static catalogs; dynamic .pb entries are
+# folded into a per-analyzer copy by _build_full_catalog
+_KEYWORD_INDEX = _index_keywords(_STATIC_CATALOG)
+KEYWORD_TO_PLAYBOOKS = MappingProxyType(_KEYWORD_INDEX)
+
+# Only single-word keywords can occur inside a task word (tasks split on \W)
+_WORD_RE = re.compile(r"\w+")
+
+
+def _build_keyword_automaton(index: Dict[str, List[str]]):
+    """Aho-Corasick automaton over the index's single-word keywords."""
+    automaton = ahocorasick.Automaton()
+    for kw in index:
+        if _WORD_RE.fullmatch(kw):
+            automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_pattern(index: Dict[str, List[str]]):
+    """Regex fallback for _build_keyword_automaton.
+
+    Returns (pattern, contains): a longest-first lookahead alternation that
+    reports the longest single-word keyword starting at each position, and
+    keyword -> keywords it contains, so shorter overlapping hits (e.g.
+    "batch" inside "batching") are recovered without a second scan.
+    """
+    single = sorted((kw for kw in index if _WORD_RE.fullmatch(kw)), key=len, reverse=True)
+    if not single:
+        return None, {}
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, single)) + "))")
+    contains = {kw: [other for other in single if other in kw] for kw in single}
+    return pattern, contains
+
+
+def _index_substrings(index: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Every substring of an index keyword -> keywords containing it.
+
+    Fuzzy matching (a task word inside a keyword) becomes one lookup per word.
+    """
+    substrings: Dict[str, List[str]] = {}
+    for kw in index:
+        n = len(kw)
+        for part in {kw[i:j] for i in range(n) for j in range(i + 1, n + 1)}:
+            substrings.setdefault(part, []).append(kw)
+    return substrings
+
+
+# Dynamic .pb catalog entries persist here between runs, keyed by the
+# playbooks directory's mtime and entry count (see _dynamic_playbooks)
+CATALOG_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "nlke", "playbook_catalog.json")
+CATALOG_CACHE_VERSION = 3  # bump when _scan_dynamic_playbooks output changes
+
+# Files the static catalogs already cover; part of the cache key so a catalog
+# change invalidates stale dynamic entries
+_KNOWN_FILES = frozenset(info["file"] for info in _STATIC_CATALOG.values())
+_KNOWN_FILES_DIGEST = hashlib.blake2b(
+    "\0".join(sorted(_KNOWN_FILES)).encode(), digest_size=8
+).hexdigest()
+
+
+# Header lines scanned for extra keywords, read in chunks of HEADER_READ_CHARS
+HEADER_LINES = 10
+HEADER_READ_CHARS = 2048
+_HEADER_KW_RE = re.compile(r'\b[a-z]{4,}\b')
+
+
+def _read_header(path: str) -> str:
+    """First HEADER_LINES lines of a file, lowercased, in as few reads as possible."""
+    with open(path, "r", errors="replace") as f:
+        head = f.read(HEADER_READ_CHARS)
+        while head.count("\n") < HEADER_LINES:
+            more = f.read(HEADER_READ_CHARS)
+            if not more:
+                break
+            head += more
+    return "\n".join(head.split("\n", HEADER_LINES)[:HEADER_LINES]).lower()
+
+
+def _scan_dynamic_playbooks() -> Dict[str, Dict]:
+    """Auto-generate catalog entries for uncataloged .pb files."""
+    catalog = {}
+    with os.scandir(CUSTOM_PLAYBOOKS_DIR) as it:
+        dir_entries = list(it)
+    for dir_entry in dir_entries:
+        entry = dir_entry.name
+        if entry.endswith(".pb") and entry not in _KNOWN_FILES:
+            # Auto-generate catalog entry from filename
+            stem = entry.replace(".pb", "")
+            parts = stem.split("-", 1)
+            category = parts[0] if len(parts) > 1 else "UNKNOWN"
+            topic_words = parts[1] if len(parts) > 1 else stem
+            topic = topic_words.replace("-", " ").title()
+
+            # Extract keywords from filename
+            keywords = [w for w in topic_words.lower().split("-") if len(w) > 2]
+
+            # Read first 10 lines for extra keywords
+            try:
+                header = _read_header(dir_entry.path)
+                extra_kw = _HEADER_KW_RE.findall(header)
+                keywords.extend([w for w in extra_kw if w not in keywords][:5])
+            except Exception:
+                pass
+
+            catalog[f"DYNAMIC-{stem}"] = {
+                "topic": topic,
+                # distinct, so len() is the score denominator; same keyword set as before
+                "keywords": tuple(dict.fromkeys(keywords)),
+                "file": entry,
+                "category": category.upper(),
+            }
+    return catalog
+
+
+def _restore_cached_catalog(entries: Dict[str, Any]) -> Dict[str, Dict]:
+    """Cached JSON entries back to scan output; ValueError if malformed."""
+    catalog = {}
+    for name, info in entries.items():
+        keywords = info["keywords"]
+        if (not isinstance(keywords, list)
+                or not all(isinstance(kw, str) for kw in keywords)
+                or not all(isinstance(info[f], str) for f in ("topic", "file", "category"))):
+            raise ValueError(f"malformed cached playbook entry: {name!r}")
+        catalog[name] = {**info, "keywords": tuple(keywords)}
+    return catalog
+
+
+@lru_cache(maxsize=8)
+def _cached_dynamic_playbooks(key: tuple) -> Dict[str, Dict]:
+    """Dynamic entries for a directory state: on-disk cache, else a rescan."""
+    try:
+        with open(CATALOG_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == list(key):
+            return _restore_cached_catalog(cached["catalog"])
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        pass  # unreadable or malformed cache: rescan and rewrite it
+
+    catalog = _scan_dynamic_playbooks()
+    try:
+        os.makedirs(os.path.dirname(CATALOG_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{CATALOG_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": list(key), "catalog": catalog}, f)
+        os.replace(tmp_path, CATALOG_CACHE_PATH)
+    except OSError:
+        pass  # cache is best-effort; the scan result is still returned
+    return catalog
+
+
+def _dynamic_playbooks() -> Dict[str, Dict]:
+    """Dynamic catalog entries, rescanned only when the directory changes.
+
+    Adding, removing or renaming a .pb file bumps the directory mtime; edits
+    to an existing file's header do not, so clear CATALOG_CACHE_PATH to pick
+    those up.
+    """
+    try:
+        st = os.stat(CUSTOM_PLAYBOOKS_DIR)
+        count = len(os.listdir(CUSTOM_PLAYBOOKS_DIR))
+    except OSError:
+        return {}
+    key = (CATALOG_CACHE_VERSION, CUSTOM_PLAYBOOKS_DIR, st.st_mtime_ns, count, _KNOWN_FILES_DIGEST)
+    return _cached_dynamic_playbooks(key)
+
+
+# From this many keyword-matched playbooks (dynamic .pb scans), hit counts come
+# from one playbook x keyword matrix product instead of per-playbook set math
+VECTORIZE_MIN_PLAYBOOKS = 256
+
+
+def _build_playbook_matrix(catalog: Dict[str, Dict], index: Dict[str, List[str]]):
+    """(playbook names, keyword -> column, 0/1 int32 incidence matrix)."""
+    names = list(catalog)
+    kw_col = {kw: i for i, kw in enumerate(index)}
+    matrix = np.zeros((len(names), len(kw_col)), dtype=np.int32)
+    for row, name in enumerate(names):
+        matrix[row, [kw_col[kw] for kw in catalog[name]["keywords"]]] = 1
+    return names, kw_col, matrix
+
+
+def _matched_keywords(keywords: frozenset, direct: set, fuzzy: set) -> List[str]:
+    """Distinct keywords a playbook matched: direct hits, else fuzzy hits
+    (task word inside the keyword)."""
+    return list(keywords & direct or keywords & fuzzy)
+
 
 # ============================================================================
 # L3: Analyzer
@@ -416,52 +663,93 @@ class PlaybookAdvisorAnalyzer(BaseAnalyzer):
         if ENGINE_AVAILABLE:
             self.engine = RuleEngine(rules_dir=Path(SYNTHESIS_RULES_DIR))
         self._full_catalog = None
+        self._keyword_index = _KEYWORD_INDEX  # plain dict on the hot path
+        self._keyword_substrings: Dict[str, List[str]] = {}
+        self._keyword_automaton = None
+        self._keyword_pattern = None  # regex fallback when pyahocorasick is absent
+        self._keyword_contains: Dict[str, List[str]] = {}
+        self._pb_keyword_sets: Dict[str, frozenset] = {}
+        self._pb_matrix = None  # _build_playbook_matrix result for large catalogs
+        self._rules_cache: Dict[str, List[Dict[str, Any]]] = {}  # topic -> _key_rules
+        self._pb_position: Dict[str, int] = {}  # catalog order, for match ordering
+        self._pb_kwcount: Dict[str, int] = {}  # score denominators
+        self._pb_file_path: Dict[str, str] = {}
+        self._catalog_by_category: Dict[str, Dict[str, Dict]] = {}  # upper category -> entries
 
     def _build_full_catalog(self) -> Dict[str, Dict]:
         """Merge core + variant catalogs and scan for undiscovered .pb files."""
         if self._full_catalog is not None:
             return self._full_catalog
 
-        catalog = {}
-        catalog.update(PLAYBOOK_CATALOG)
-        catalog.update(VARIANT_CATALOG)
-
-        # Dynamic scan for any .pb files not already cataloged
-        known_files = {v["file"] for v in catalog.values()}
-
-        if os.path.isdir(CUSTOM_PLAYBOOKS_DIR):
-            for entry in os.listdir(CUSTOM_PLAYBOOKS_DIR):
-                if entry.endswith(".pb") and entry not in known_files:
-                    # Auto-generate catalog entry from filename
-                    stem = entry.replace(".pb", "")
-                    parts = stem.split("-", 1)
-                    category = parts[0] if len(parts) > 1 else "UNKNOWN"
-                    topic_words = parts[1] if len(parts) > 1 else stem
-                    topic = topic_words.replace("-", " ").title()
-
-                    # Extract keywords from filename
-                    keywords = [w for w in topic_words.lower().split("-") if len(w) > 2]
-
-                    # Read first 10 lines for extra keywords
-                    try:
-                        filepath = os.path.join(CUSTOM_PLAYBOOKS_DIR, entry)
-                        with open(filepath, "r", errors="replace") as f:
-                            header = "".join(f.readline() for _ in range(10)).lower()
-                        extra_kw = re.findall(r'\b[a-z]{4,}\b', header)
-                        keywords.extend([w for w in extra_kw if w not in keywords][:5])
-                    except Exception:
-                        pass
-
-                    catalog[f"DYNAMIC-{stem}"] = {
-                        "topic": topic,
-                        "keywords": keywords,
-                        "file": entry,
-                        "category": category.upper(),
-                    }
+        catalog = dict(_STATIC_CATALOG)
+
+        # Dynamic entries for any .pb files not already cataloged
+        catalog.update(_dynamic_playbooks())
 
         self._full_catalog = catalog
+        if len(catalog) > len(PLAYBOOK_CATALOG) + len(VARIANT_CATALOG):
+            self._keyword_index = _index_keywords(catalog)
+        self._keyword_substrings = _index_substrings(self._keyword_index)
+        if HAS_AHOCORASICK:
+            self._keyword_automaton = _build_keyword_automaton(self._keyword_index)
+        else:
+            self._keyword_pattern, self._keyword_contains = _build_keyword_pattern(self._keyword_index)
+        self._pb_keyword_sets = {
+            name: frozenset(info["keywords"]) for name, info in catalog.items()
+        }
+        self._pb_position = {name: i for i, name in enumerate(catalog)}
+        self._catalog_by_category = {}
+        for name, info in catalog.items():
+            self._catalog_by_category.setdefault(info.get("category", "").upper(), {})[name] = info
+        self._pb_kwcount = {name: len(info["keywords"]) for name, info in catalog.items()}
+        self._pb_file_path = {
+            name: os.path.join(CUSTOM_PLAYBOOKS_DIR, info["file"]) if "file" in info else ""
+            for name, info in catalog.items()
+        }
+        if HAS_NUMPY and len(self._pb_keyword_sets) >= VECTORIZE_MIN_PLAYBOOKS:
+            self._pb_matrix = _build_playbook_matrix(catalog, self._keyword_index)
         return catalog
 
+    def _hit_counts(self, candidates: set, direct: set, fuzzy: set) -> Dict[str, int]:
+        """Distinct keywords each candidate playbook matched (direct, else fuzzy)."""
+        if self._pb_matrix is not None and candidates:
+            names, kw_col, matrix = self._pb_matrix
+            direct_vec = np.zeros(len(kw_col), dtype=np.int32)
+            direct_vec[[kw_col[kw] for kw in direct]] = 1
+            fuzzy_vec = np.zeros(len(kw_col), dtype=np.int32)
+            fuzzy_vec[[kw_col[kw] for kw in fuzzy]] = 1
+            direct_hits = matrix @ direct_vec
+            hits = np.where(direct_hits > 0, direct_hits, matrix @ fuzzy_vec)
+            return {names[row]: int(hits[row]) for row in np.flatnonzero(hits)}
+        counts = {}
+        for name in candidates:
+            kw_set = self._pb_keyword_sets[name]
+            counts[name] = len(kw_set & direct) or len(kw_set & fuzzy)
+        return counts
+
+    def _ensure_loaded(self):
+        """Lazy-load rules on first use (a load drops the per-topic rules memo)."""
+        if self.engine and not self.engine.loaded:
+            self.engine.load_rules()
+            self._rules_cache.clear()
+
+    def _key_rules(self, topic: str) -> List[Dict[str, Any]]:
+        """Top engine rules for a playbook topic (empty without the engine).
+
+        Memoized per topic; callers run _ensure_loaded first.
+        """
+        if not self.engine:
+            return []
+        key_rules = self._rules_cache.get(topic)
+        if key_rules is None:
+            found = self.engine.find_rules(topic)
+            key_rules = self._rules_cache[topic] = [{
+                "rule_id": r.get("rule_id", ""),
+                "title": r.get("title", ""),
+                "confidence": r.get("metadata", {}).get("confidence", 0),
+            } for r in found[:5]]
+        return key_rules
+
     def get_example_input(self) -> Dict[str, Any]:
         return {
             "name": "Find Playbooks for KG Enhancement Pipeline",
@@ -489,61 +777,65 @@ class PlaybookAdvisorAnalyzer(BaseAnalyzer):
 
         # Optional category filter
         if category_filter:
-            cat_upper = category_filter.upper()
-            catalog = {k: v for k, v in full_catalog.items() if v.get("category", "").upper() == cat_upper}
+            catalog = self._catalog_by_category.get(category_filter.upper(), {})
         else:
             catalog = full_catalog
 
-        # Keyword matching
-        words = set(re.findall(r'\w+', description))
+        # Keyword matching: resolve each distinct keyword once, then visit only
+        # the playbooks the inverted index links to a hit
+        # (catalog keywords are normalized lowercase, so only the task text is lowered)
+        words = set(_WORD_RE.findall(description))
+        keyword_index = self._keyword_index
+        if words:
+            if self._keyword_automaton is not None:
+                # One pass over the task text finds every keyword inside a word
+                direct = {kw for _, kw in self._keyword_automaton.iter(description)}
+            elif self._keyword_pattern is not None:
+                contains = self._keyword_contains
+                direct = {kw for m in self._keyword_pattern.finditer(description)
+                          for kw in contains[m.group(1)]}
+            else:
+                direct = set()
+            substrings = self._keyword_substrings
+            fuzzy = direct.union(*[substrings[w] for w in words if w in substrings])
+        else:
+            direct = fuzzy = set()
+        candidates = {pb_name for kw in fuzzy for pb_name in keyword_index[kw]}
+        hit_counts = self._hit_counts(candidates, direct, fuzzy)
+        # Score every hit as a plain (score, name) tuple; PlaybookMatch
+        # objects are only built for the reported top matches
+        kwcount, file_paths, position = self._pb_kwcount, self._pb_file_path, self._pb_position
+        scores = {name: round(hits / kwcount[name], 2)
+                  for name, hits in hit_counts.items() if hits and name in catalog}
+
+        # One pass over the hits in score order (ties keep catalog order) fills
+        # both the match list and the category breakdown; the top matches are
+        # its prefix
         matches = []
-
-        for pb_name, pb_info in catalog.items():
-            matched_kw = [kw for kw in pb_info["keywords"] if kw in words or any(kw in w for w in words)]
-            if not matched_kw:
-                # Fuzzy: check substring matches
-                for kw in pb_info["keywords"]:
-                    for word in words:
-                        if kw in word or word in kw:
-                            matched_kw.append(kw)
-                            break
-
-            if matched_kw:
-                score = len(set(matched_kw)) / len(pb_info["keywords"])
-                # Load rules from engine if available
-                key_rules = []
-                if self.engine:
-                    if not self.engine.loaded:
-                        self.engine.load_rules()
-                    found = self.engine.find_rules(pb_info["topic"])
-                    key_rules = [{
-                        "rule_id": r.get("rule_id", ""),
-                        "title": r.get("title", ""),
-                        "confidence": r.get("metadata", {}).get("confidence", 0),
-                    } for r in found[:5]]
-
-                file_path = ""
-                if "file" in pb_info:
-                    file_path = os.path.join(CUSTOM_PLAYBOOKS_DIR, pb_info["file"])
-
-                matches.append(PlaybookMatch(
-                    name=pb_name,
-                    topic=pb_info["topic"],
-                    relevance_score=round(score, 2),
-                    matched_keywords=list(set(matched_kw)),
-                    key_rules=key_rules,
-                    rule_count=len(key_rules),
-                    file_path=file_path,
-                    category=pb_info.get("category", ""),
-                ))
-
-        matches.sort(key=lambda m: m.relevance_score, reverse=True)
-        top_matches = matches[:max_pb]
-
-        # Category breakdown
-        by_category = {}
-        for m in matches:
-            by_category.setdefault(m.category, []).append(m.name)
+        by_category: Dict[str, List[str]] = {}
+        for pb_name in sorted(scores, key=lambda name: (-scores[name], position[name])):
+            matches.append((scores[pb_name], pb_name))
+            by_category.setdefault(catalog[pb_name].get("category", ""), []).append(pb_name)
+        top_scored = matches[:max_pb]
+        if top_scored:
+            self._ensure_loaded()
+        top_matches = []
+        for score, pb_name in top_scored:
+            pb_info = catalog[pb_name]
+            matched_keywords = _matched_keywords(self._pb_keyword_sets[pb_name], direct, fuzzy)
+            key_rules = self._key_rules(pb_info["topic"])
+            top_matches.append(PlaybookMatch(
+                name=pb_name,
+                topic=pb_info["topic"],
+                relevance_score=score,
+                matched_keywords=matched_keywords,
+                key_rules=key_rules,
+                rule_count=len(key_rules),
+                file_path=file_paths[pb_name],
+                category=pb_info.get("category", ""),
+            ))
+
+        match_dicts = [m.to_dict() for m in top_matches]
 
         recommendations = [{
             "technique": "playbook_advisory",
@@ -553,7 +845,7 @@ class PlaybookAdvisorAnalyzer(BaseAnalyzer):
             "variant_playbooks": total_variant,
             "dynamic_playbooks": total_dynamic,
             "matched": len(matches),
-            "top_matches": [asdict(m) for m in top_matches],
+            "top_matches": match_dicts,
             "by_category": {k: len(v) for k, v in by_category.items()},
             "rules_applied": rules_applied,
         }]
@@ -580,7 +872,7 @@ class PlaybookAdvisorAnalyzer(BaseAnalyzer):
             rules_applied=rules_applied,
             meta_insight=meta_insight,
             analysis_data={
-                "matches": [asdict(m) for m in top_matches],
+                "matches": match_dicts,
                 "total_matched": len(matches),
                 "catalog_size": len(catalog),
                 "task_keywords": list(words)[:20],
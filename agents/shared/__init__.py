@@ -1,32 +1,4 @@
 """NLKE Agent Shared Module - 5-Layer Pattern Base."""
-from .agent_base import (
-    AgentInput,
-    AgentOutput,
-    BaseAnalyzer,
-    AgentOrchestrator,
-    run_standard_cli,
-    NLKE_ROOT,
-    AGENTS_DIR,
-    CONTEXT_PACKETS_DIR,
-    AILAB_ROOT,
-    AILAB_TOOLS,
-    AILAB_HANDBOOKS,
-    SYNTHESIS_RULES_ROOT,
-    SYNTHESIS_ENGINE_DIR,
-    SYNTHESIS_RULES_DIR,
-    SYNTHESIS_PLAYBOOKS_DIR,
-    SYNTHESIS_CONSOLIDATED,
-    CUSTOM_PLAYBOOKS_DIR,
-    GEMINI_API_BASE,
-    GEMINI_MODELS,
-    GEMINI_CAPABILITIES,
-    CLAUDE_CAPABILITIES,
-    PRICING,
-    THRESHOLDS,
-    KG_DATABASES,
-    TOKENS_PER_MILLION,
-)
-
 __all__ = [
     "AgentInput",
     "AgentOutput",
@@ -54,3 +26,12 @@ __all__ = [
     "KG_DATABASES",
     "TOKENS_PER_MILLION",
 ]
+
+
+def __getattr__(name: str):
+    # PEP 562: agent_base is imported on first access, so importing a sibling
+    # module (e.g. shared.agent_sdk) does not pay for it up front
+    if name in __all__:
+        from . import agent_base
+        return getattr(agent_base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
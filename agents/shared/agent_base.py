@@ -205,6 +205,13 @@ THRESHOLDS = {
 }
 
 
+def dumps_json(obj: Any, indent: Optional[int] = 2) -> str:
+    """Serialize an agent result (dict or dataclass) to JSON, like AgentOutput.to_json."""
+    if hasattr(obj, "__dataclass_fields__"):
+        obj = asdict(obj)
+    return json.dumps(obj, indent=indent, default=str)
+
+
 # ============================================================================
 # L3: BaseAnalyzer (Abstract)
 # ============================================================================
@@ -20,9 +20,7 @@ Created: February 6, 2026
 
 import os
 import sys
-import json
-import importlib
-import importlib.util
+import threading
 import time
 from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Any, Optional, Callable
@@ -77,6 +75,11 @@ AGENT_MODULES = {
 }
 
 
+# Agents a Pipeline runs at once (analyzers are synchronous; each runs on a
+# worker thread, and steps of the same agent take turns)
+PIPELINE_CONCURRENCY = 8
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -110,6 +113,13 @@ class AgentRunner:
     """Run a single NLKE agent by name with given workload."""
 
     _cache: Dict[str, Any] = {}
+    _locks: Dict[str, threading.Lock] = {}  # one per agent: cached analyzers are shared
+    _locks_guard = threading.Lock()
+
+    @classmethod
+    def _agent_lock(cls, agent_name: str) -> threading.Lock:
+        with cls._locks_guard:
+            return cls._locks.setdefault(agent_name, threading.Lock())
 
     @classmethod
     def load_analyzer(cls, agent_name: str):
@@ -131,6 +141,7 @@ class AgentRunner:
         if not full_path.exists():
             raise FileNotFoundError(f"Agent module not found: {full_path}")
 
+        import importlib.util  # deferred: only needed once per agent
         spec = importlib.util.spec_from_file_location(module_name, str(full_path))
         mod = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(mod)
@@ -154,13 +165,14 @@ class AgentRunner:
         """Run an agent with the given workload, returning a StepResult."""
         start = time.time()
         try:
-            analyzer = cls.load_analyzer(agent_name)
-            if workload is None:
-                workload = analyzer.get_example_input()
+            with cls._agent_lock(agent_name):
+                analyzer = cls.load_analyzer(agent_name)
+                if workload is None:
+                    workload = analyzer.get_example_input()
 
-            from shared.agent_base import AgentInput
-            agent_input = AgentInput(workload=workload)
-            output = analyzer.analyze(agent_input)
+                from shared.agent_base import AgentInput
+                agent_input = AgentInput(workload=workload)
+                output = analyzer.analyze(agent_input)
 
             return StepResult(
                 agent_name=agent_name,
@@ -208,50 +220,76 @@ class Pipeline:
         ))
         return self
 
-    def run(self) -> PipelineResult:
-        """Execute the pipeline sequentially (respecting dependencies)."""
-        results: Dict[str, StepResult] = {}
-        all_steps: List[StepResult] = []
+    def run(self, concurrency: int = PIPELINE_CONCURRENCY) -> PipelineResult:
+        """Execute the pipeline (respecting dependencies); see run_async.
+
+        Inside a running event loop this blocks the loop until the pipeline
+        is done; await run_async() there instead where possible.
+        """
+        import asyncio
+        coro = self.run_async(concurrency)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # Called from inside an event loop (e.g. a FastAPI handler): use a helper thread
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+    async def run_async(self, concurrency: int = PIPELINE_CONCURRENCY) -> PipelineResult:
+        """Execute the pipeline, running steps whose dependencies are done concurrently.
+
+        A step depends on the most recent earlier step of each agent named in
+        depends_on (names not yet added are ignored, as in insertion order).
+        At most `concurrency` agents run at once, on worker threads; results
+        are reported in insertion order.
+        """
+        # Deferred so importing the SDK (e.g. for AGENT_MODULES) stays cheap
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
 
         start = time.time()
+        concurrency = max(1, concurrency)
 
-        for step in self.steps:
-            # Check dependencies
-            for dep in step.depends_on:
-                if dep in results and not results[dep].success:
-                    sr = StepResult(
-                        agent_name=step.agent_name,
-                        success=False,
-                        output={},
-                        duration_ms=0,
-                        error=f"Dependency failed: {dep}",
-                    )
-                    results[step.agent_name] = sr
-                    all_steps.append(sr)
-                    continue
-
-            # Transform workload from previous step output
-            workload = step.workload
-            if step.transform and step.depends_on:
-                dep_name = step.depends_on[0]
-                if dep_name in results and results[dep_name].success:
-                    try:
-                        workload = step.transform(results[dep_name].output)
-                    except Exception as e:
-                        sr = StepResult(
-                            agent_name=step.agent_name,
-                            success=False,
-                            output={},
-                            duration_ms=0,
-                            error=f"Transform failed: {e}",
-                        )
-                        results[step.agent_name] = sr
-                        all_steps.append(sr)
+        # Resolve depends_on names to indices of earlier steps
+        dep_indices: List[Dict[str, int]] = []
+        latest: Dict[str, int] = {}
+        for i, step in enumerate(self.steps):
+            dep_indices.append({d: latest[d] for d in step.depends_on if d in latest})
+            latest[step.agent_name] = i
+
+        step_results: List[Optional[StepResult]] = [None] * len(self.steps)
+        pending = list(range(len(self.steps)))
+        active: Dict["asyncio.Task", int] = {}
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while pending or active:
+                # Admit ready steps (all dependencies finished) into the window
+                waiting = []
+                for i in pending:
+                    deps = dep_indices[i]
+                    if len(active) >= concurrency or any(step_results[j] is None for j in deps.values()):
+                        waiting.append(i)
+                        continue
+                    workload, failure = self._step_workload(self.steps[i], deps, step_results)
+                    if failure is not None:
+                        step_results[i] = failure
                         continue
+                    future = loop.run_in_executor(
+                        executor, AgentRunner.run, self.steps[i].agent_name, workload
+                    )
+                    active[asyncio.ensure_future(future)] = i
+                pending = waiting
+                if not active:
+                    continue  # resolved failures may have readied more steps
 
-            sr = AgentRunner.run(step.agent_name, workload)
-            results[step.agent_name] = sr
-            all_steps.append(sr)
+                done, _ = await asyncio.wait(active, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_results[active.pop(task)] = task.result()
+
+        all_steps: List[StepResult] = step_results
 
         # Aggregate results
         all_recs = []
@@ -277,6 +315,38 @@ class Pipeline:
             aggregated_rules=sorted(all_rules),
         )
 
+    @staticmethod
+    def _step_workload(step: PipelineStep, deps: Dict[str, int],
+                       step_results: List[Optional[StepResult]]):
+        """(workload, None) for a runnable step, or (None, failed StepResult)."""
+        # Check dependencies
+        for dep, j in deps.items():
+            if not step_results[j].success:
+                return None, StepResult(
+                    agent_name=step.agent_name,
+                    success=False,
+                    output={},
+                    duration_ms=0,
+                    error=f"Dependency failed: {dep}",
+                )
+
+        # Transform workload from previous step output
+        workload = step.workload
+        if step.transform and step.depends_on:
+            dep_name = step.depends_on[0]
+            if dep_name in deps:
+                try:
+                    workload = step.transform(step_results[deps[dep_name]].output)
+                except Exception as e:
+                    return None, StepResult(
+                        agent_name=step.agent_name,
+                        success=False,
+                        output={},
+                        duration_ms=0,
+                        error=f"Transform failed: {e}",
+                    )
+        return workload, None
+
     def describe(self) -> str:
         """Print pipeline description."""
         lines = [f"Pipeline: {self.name}", f"Steps: {len(self.steps)}"]
@@ -294,6 +364,10 @@ if __name__ == "__main__":
     print("NLKE Agent SDK Orchestrator")
     print(f"Available agents: {len(AGENT_MODULES)}")
     print(f"Agent list: {', '.join(sorted(AGENT_MODULES.keys()))}")
+    if "--list" in sys.argv[1:]:
+        sys.exit(0)
+
+    import json
 
     # Demo pipeline
     print("\n--- Demo Pipeline ---")
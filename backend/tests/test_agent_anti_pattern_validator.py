@@ -0,0 +1,98 @@
+"""Unit tests for the anti-pattern validator agent (agents/rule-engine/anti_pattern_validator.py).
+
+These tests exercise the per-analyzer analyze() result cache. They run
+with or without the synthesis rule engine installed. They do NOT make
+API calls.
+
+Run:
+    python -m pytest backend/tests/test_agent_anti_pattern_validator.py -v
+    python -m unittest backend.tests.test_agent_anti_pattern_validator -v
+"""
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+AGENTS_DIR = Path(__file__).resolve().parent.parent.parent / "agents"
+
+
+def _load_validator():
+    """Load anti_pattern_validator from its file path (rule-engine is not a package name)."""
+    spec = importlib.util.spec_from_file_location(
+        "anti_pattern_validator", str(AGENTS_DIR / "rule-engine" / "anti_pattern_validator.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+apv = _load_validator()
+
+from shared.agent_base import AgentInput  # noqa: E402  (agents dir added by the module above)
+
+
+def _result(output):
+    """An AgentOutput without its per-call metadata."""
+    data = output.to_dict()
+    del data["agent_metadata"]
+    return data
+
+
+class TestAnalyzeCache(unittest.TestCase):
+    """Test reuse of analyze() results for identical workloads."""
+
+    def setUp(self):
+        self.analyzer = apv.AntiPatternValidatorAnalyzer()
+        self.workload = self.analyzer.get_example_input()
+
+    def _analyze(self, **overrides):
+        return self.analyzer.analyze(AgentInput(workload={**self.workload, **overrides}))
+
+    def test_hit_matches_miss(self):
+        """A cached result equals the computed one, with fresh metadata."""
+        first = self._analyze()
+        second = self._analyze()
+        self.assertEqual(len(self.analyzer._analyze_cache), 1)
+        self.assertEqual(_result(second), _result(first))
+        self.assertIsNot(second.agent_metadata, first.agent_metadata)
+        self.assertTrue(second.analysis_data["violations"])
+
+    def test_callers_cannot_mutate_the_entry(self):
+        """Mutating a returned result (miss or hit) leaves later hits intact."""
+        first = self._analyze()
+        expected = _result(first)
+        first.analysis_data["violations"].clear()
+        first.recommendations[0]["pass"] = "changed"
+        second = self._analyze()
+        self.assertEqual(_result(second), expected)
+        second.anti_patterns.append("changed")
+        second.analysis_data["by_severity"].clear()
+        self.assertEqual(_result(self._analyze()), expected)
+
+    def test_distinct_workloads_get_distinct_entries(self):
+        """Values equal across types (1, True) and different contexts are not conflated."""
+        self._analyze(context={"max_iterations": 1})
+        self._analyze(context={"max_iterations": True})
+        self._analyze(features=["batch_api"])
+        self.assertEqual(len(self.analyzer._analyze_cache), 3)
+
+    def test_lru_bound(self):
+        """The cache keeps only the ANALYZE_CACHE_SIZE most recent workloads."""
+        size = apv.ANALYZE_CACHE_SIZE
+        for i in range(size + 5):
+            self._analyze(context={"run": i})
+        self.assertEqual(len(self.analyzer._analyze_cache), size)
+        keys = list(self.analyzer._analyze_cache)
+        self.assertEqual(keys[0], apv._workload_key(self.workload["features"], {"run": 5}))
+
+    def test_uncacheable_workloads_still_analyze(self):
+        """Unhashable or unmarshallable workloads are analyzed but not cached."""
+        for overrides in ({"context": {"buffer": bytearray(b"x")}},  # unhashable
+                          {"features": ["batch_api", object()]}):  # marshal can't encode
+            with self.subTest(overrides=overrides):
+                out = self._analyze(**overrides)
+                self.assertIsInstance(out.meta_insight, str)
+        self.assertEqual(len(self.analyzer._analyze_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+"""Unit tests for agent pipelines (agents/shared/agent_sdk.py Pipeline).
+
+These tests exercise dependency ordering, concurrency and failure
+propagation with AgentRunner.run stubbed out. They do NOT load agents
+or make API calls.
+
+Run:
+    python -m pytest backend/tests/test_agent_sdk_pipeline.py -v
+    python -m unittest backend.tests.test_agent_sdk_pipeline -v
+"""
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Agents import as <package>.<module> with the agents dir on the path
+AGENTS_DIR = Path(__file__).resolve().parent.parent.parent / "agents"
+sys.path.insert(0, str(AGENTS_DIR))
+
+from shared.agent_sdk import AgentRunner, Pipeline, StepResult  # noqa: E402
+
+
+class _FakeRunner:
+    """Stand-in for AgentRunner.run that records when each agent starts and ends."""
+
+    def __init__(self, delay=0.05, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.lock = threading.Lock()
+        self.events = []  # (agent_name, "start" | "end", monotonic time)
+        self.workloads = {}
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, agent_name, workload=None):
+        with self.lock:
+            self.events.append((agent_name, "start", time.monotonic()))
+            self.workloads[agent_name] = workload
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+            self.events.append((agent_name, "end", time.monotonic()))
+        if agent_name in self.failing:
+            return StepResult(agent_name, False, {}, self.delay * 1000, error=f"{agent_name} broke")
+        return StepResult(agent_name, True, {
+            "recommendations": [{"technique": agent_name}],
+            "rules_applied": [f"rule_{agent_name}"],
+        }, self.delay * 1000)
+
+    def time_of(self, agent_name, event):
+        return next(t for name, kind, t in self.events if name == agent_name and kind == event)
+
+
+class PipelineTestCase(unittest.TestCase):
+
+    def stub_runner(self, **kwargs):
+        runner = _FakeRunner(**kwargs)
+        patcher = mock.patch.object(AgentRunner, "run", runner)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return runner
+
+
+class TestPipelineOrdering(PipelineTestCase):
+    """Test that steps wait for their dependencies."""
+
+    def test_dag_order(self):
+        """A diamond a -> (b, c) -> d runs b and c after a, and d after both."""
+        runner = self.stub_runner()
+        result = (Pipeline("diamond")
+                  .add("a")
+                  .add("b", depends_on=["a"])
+                  .add("c", depends_on=["a"])
+                  .add("d", depends_on=["b", "c"])
+                  .run())
+
+        self.assertEqual(result.succeeded, 4)
+        self.assertEqual([s.agent_name for s in result.steps], ["a", "b", "c", "d"])
+        a_end = runner.time_of("a", "end")
+        self.assertGreaterEqual(runner.time_of("b", "start"), a_end)
+        self.assertGreaterEqual(runner.time_of("c", "start"), a_end)
+        self.assertGreaterEqual(runner.time_of("d", "start"),
+                                max(runner.time_of("b", "end"), runner.time_of("c", "end")))
+        self.assertEqual(result.aggregated_rules, ["rule_a", "rule_b", "rule_c", "rule_d"])
+
+    def test_transform_receives_dependency_output(self):
+        """transform turns the first dependency's output into the step's workload."""
+        runner = self.stub_runner(delay=0)
+        (Pipeline("transform")
+         .add("a")
+         .add("b", depends_on=["a"],
+              transform=lambda out: {"from": out["recommendations"][0]["technique"]})
+         .run())
+        self.assertEqual(runner.workloads["b"], {"from": "a"})
+
+
+class TestPipelineConcurrency(PipelineTestCase):
+    """Test that independent steps overlap, up to `concurrency`."""
+
+    def test_independent_steps_run_concurrently(self):
+        """Four independent steps all run at once and finish in about one step's time."""
+        runner = self.stub_runner(delay=0.2)
+        pipeline = Pipeline("fan-out")
+        for name in "abcd":
+            pipeline.add(name)
+        start = time.monotonic()
+        result = pipeline.run(concurrency=4)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(result.succeeded, 4)
+        self.assertEqual(runner.peak, 4)
+        self.assertLess(elapsed, 0.6)
+
+    def test_concurrency_limit(self):
+        """No more than `concurrency` steps are in flight."""
+        runner = self.stub_runner(delay=0.05)
+        pipeline = Pipeline("limited")
+        for name in "abcdef":
+            pipeline.add(name)
+        result = pipeline.run(concurrency=2)
+        self.assertEqual(result.succeeded, 6)
+        self.assertEqual(runner.peak, 2)
+
+
+class TestPipelineFailures(PipelineTestCase):
+    """Test how a failing step affects the rest of the pipeline."""
+
+    def test_failure_propagates_to_dependents(self):
+        """Dependents of a failed step fail (transitively); independent steps still run."""
+        runner = self.stub_runner(delay=0, failing={"a"})
+        result = (Pipeline("failing")
+                  .add("a")
+                  .add("b", depends_on=["a"])
+                  .add("c", depends_on=["b"])
+                  .add("d")
+                  .run())
+
+        by_name = {s.agent_name: s for s in result.steps}
+        self.assertEqual(by_name["a"].error, "a broke")
+        self.assertEqual(by_name["b"].error, "Dependency failed: a")
+        self.assertEqual(by_name["c"].error, "Dependency failed: b")
+        self.assertTrue(by_name["d"].success)
+        self.assertEqual((result.succeeded, result.failed), (1, 3))
+        self.assertEqual({name for name, _, _ in runner.events}, {"a", "d"})
+        self.assertEqual(result.aggregated_rules, ["rule_d"])
+
+    def test_transform_failure(self):
+        """A transform that raises fails its step without running the agent."""
+        runner = self.stub_runner(delay=0)
+        result = (Pipeline("bad-transform")
+                  .add("a")
+                  .add("b", depends_on=["a"], transform=lambda out: out["missing"])
+                  .run())
+        self.assertEqual(result.steps[1].error, "Transform failed: 'missing'")
+        self.assertNotIn("b", runner.workloads)
+
+    def test_agent_error_becomes_failed_step(self):
+        """An agent that cannot be loaded is reported as a failed step, not raised."""
+        result = Pipeline("unknown").add("no-such-agent").run()
+        self.assertEqual(result.failed, 1)
+        self.assertIn("Unknown agent: no-such-agent", result.steps[0].error)
+
+
+class TestPipelineEventLoop(PipelineTestCase):
+    """Test running pipelines from async code."""
+
+    def test_run_inside_running_loop(self):
+        """run() works when called from inside a running event loop."""
+        self.stub_runner(delay=0)
+        pipeline = Pipeline("in-loop").add("a").add("b", depends_on=["a"])
+
+        async def handler():
+            return pipeline.run()
+
+        result = asyncio.run(handler())
+        self.assertEqual(result.succeeded, 2)
+
+    def test_run_async(self):
+        """run_async() can be awaited directly."""
+        self.stub_runner(delay=0)
+        pipeline = Pipeline("awaited").add("a").add("b", depends_on=["a"])
+        result = asyncio.run(pipeline.run_async())
+        self.assertEqual(result.succeeded, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
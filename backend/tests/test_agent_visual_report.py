@@ -0,0 +1,172 @@
+"""Unit tests for the visual report agent (agents/reporting/visual_report.py).
+
+These tests exercise chart validation and file rendering. They need
+matplotlib and are skipped without it. They do NOT make API calls.
+
+Run:
+    python -m pytest backend/tests/test_agent_visual_report.py -v
+    python -m unittest backend.tests.test_agent_visual_report -v
+"""
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agents import as <category>.<module> with the agents dir on the path
+AGENTS_DIR = Path(__file__).resolve().parent.parent.parent / "agents"
+sys.path.insert(0, str(AGENTS_DIR))
+
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+
+@unittest.skipUnless(HAS_MATPLOTLIB, "matplotlib not installed")
+class TestChartDrawers(unittest.TestCase):
+    """Test the bar/pie drawers' input validation."""
+
+    def setUp(self):
+        from reporting import visual_report as vr
+
+        self.vr = vr
+        self.plt = vr._get_plt()
+        self.fig, self.ax = self.plt.subplots()
+
+    def tearDown(self):
+        self.plt.close(self.fig)
+
+    def _bar(self, labels, values):
+        spec = self.vr.ChartSpec("bar", "t", {"labels": labels, "values": values})
+        return self.vr._draw_bar_chart(spec, self.ax)
+
+    def test_bar_matching_values(self):
+        """One value per label renders, labelled with the raw values."""
+        self.assertTrue(self._bar(["a", "b", "c"], [1, 2, 3]))
+        texts = [t.get_text() for t in self.ax.texts]
+        self.assertEqual(texts, ["1", "2", "3"])
+
+    def test_bar_single_value_broadcasts(self):
+        """A one-element value list is drawn under every label, as ax.bar broadcasts it."""
+        self.assertTrue(self._bar(["a", "b", "c"], [5]))
+        self.assertEqual([p.get_height() for p in self.ax.patches], [5.0, 5.0, 5.0])
+        texts = [t.get_text() for t in self.ax.texts]
+        self.assertEqual(texts, ["5", "", ""])
+
+    def test_bar_rejects_unbroadcastable_values(self):
+        """Length mismatches, scalars and non-numeric values fail the chart."""
+        self.assertFalse(self._bar(["a", "b", "c"], [1, 2]))
+        self.assertFalse(self._bar(["a", "b", "c"], 5))
+        self.assertFalse(self._bar(["a", "b"], ["x", "y"]))
+
+    def test_pie_requires_one_value_per_label(self):
+        """Pie charts keep matplotlib's one-value-per-label rule."""
+        spec = self.vr.ChartSpec("pie", "t", {"labels": ["a", "b"], "values": [1]})
+        self.assertFalse(self.vr._draw_pie_chart(spec, self.ax))
+        spec = self.vr.ChartSpec("pie", "t", {"labels": ["a", "b"], "values": [1, 3]})
+        self.assertTrue(self.vr._draw_pie_chart(spec, self.ax))
+
+
+class TestRenderOptions(unittest.TestCase):
+    """Test workload option validation in analyze()."""
+
+    def _analyze(self, **workload):
+        from reporting.visual_report import VisualReportAnalyzer
+        from shared.agent_base import AgentInput
+
+        charts = [{"chart_type": "bar", "title": "t", "data": {"labels": ["a"], "values": [1]}}]
+        return VisualReportAnalyzer().analyze(AgentInput(workload={"charts": charts, **workload}))
+
+    def test_invalid_dpi_falls_back_to_default(self):
+        """Non-numeric or non-positive dpi renders at DEFAULT_DPI with an anti-pattern."""
+        from reporting.visual_report import DEFAULT_DPI
+
+        for dpi in ("high", None, 0, -50, float("nan")):
+            with self.subTest(dpi=dpi):
+                out = self._analyze(dpi=dpi)
+                self.assertEqual(out.agent_metadata["render"]["dpi"], DEFAULT_DPI)
+                self.assertTrue(any("Invalid dpi" in a for a in out.anti_patterns))
+
+    def test_numeric_dpi_is_used(self):
+        """A numeric string dpi is accepted as before."""
+        out = self._analyze(dpi="72")
+        self.assertEqual(out.agent_metadata["render"]["dpi"], 72)
+        self.assertFalse(any("Invalid dpi" in a for a in out.anti_patterns))
+
+
+@unittest.skipUnless(HAS_MATPLOTLIB, "matplotlib not installed")
+class TestChartFileCache(unittest.TestCase):
+    """Test repeated renders through the on-disk chart cache."""
+
+    def test_repeated_renders_leave_no_link_files(self):
+        """Rendering one report three times succeeds and leaves no *.link temporaries."""
+        from reporting.visual_report import VisualReportAnalyzer
+        from shared.agent_base import AgentInput
+
+        charts = [
+            {"chart_type": "bar", "title": "Bars", "data": {"labels": ["a", "b"], "values": [1, 2]}},
+            {"chart_type": "line", "title": "Line", "data": {"y": [1, 3, 2]}},
+        ]
+        with tempfile.TemporaryDirectory() as out_dir:
+            analyzer = VisualReportAnalyzer()
+            workload = {"charts": charts, "output_dir": out_dir, "generate_files": True}
+            for _ in range(3):
+                out = analyzer.analyze(AgentInput(workload=workload))
+                self.assertEqual(out.analysis_data["report"]["charts_failed"], 0)
+                self.assertEqual(len(out.analysis_data["report"]["output_files"]), 2)
+            analyzer.close()
+
+            self.assertEqual(list(Path(out_dir).rglob("*.link")), [])
+            self.assertEqual(list(Path(out_dir).rglob("*.tmp")), [])
+            self.assertEqual(len(list(Path(out_dir, ".cache").iterdir())), 2)
+
+
+def _load_by_path(module_name="visual_report"):
+    """Load visual_report from its file path, the way AgentRunner.load_analyzer does."""
+    spec = importlib.util.spec_from_file_location(module_name, str(AGENTS_DIR / "reporting" / "visual_report.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@unittest.skipUnless(HAS_MATPLOTLIB, "matplotlib not installed")
+class TestRenderPool(unittest.TestCase):
+    """Test the shared process pool used for larger reports."""
+
+    def setUp(self):
+        self.vr = _load_by_path()
+        self.vr.RENDER_POOL_WORKERS = 2  # take the pool path even on one CPU
+
+    def tearDown(self):
+        self.vr.shutdown_render_pool()
+
+    def test_path_loaded_module_renders_in_pool(self):
+        """A module loaded from its file path still renders through the pool."""
+        from shared.agent_base import AgentInput
+
+        charts = [{"chart_type": "bar", "title": f"Chart {i}",
+                   "data": {"labels": ["a", "b"], "values": [i, i + 1]}}
+                  for i in range(self.vr.PARALLEL_MIN_CHARTS)]
+        self.assertIsNotNone(self.vr._render_pool_module())
+        with tempfile.TemporaryDirectory() as out_dir:
+            workload = {"charts": charts, "output_dir": out_dir, "generate_files": True}
+            out = self.vr.VisualReportAnalyzer().analyze(AgentInput(workload=workload))
+            self.assertIsNotNone(self.vr._render_pool)
+            files = out.analysis_data["report"]["output_files"]
+            self.assertEqual(len(files), len(charts))
+            self.assertTrue(all(Path(f).stat().st_size > 0 for f in files))
+
+    def test_shutdown_waits_for_reports_using_the_pool(self):
+        """Shutting the pool down mid-report retires it; it stops once the report is done."""
+        with self.vr._leased_render_pool() as pool:
+            self.vr.shutdown_render_pool()
+            self.assertIsNone(self.vr._render_pool)
+            self.assertEqual(pool.submit(sum, [1, 2]).result(), 3)
+            self.assertFalse(pool._shutdown_thread)
+        self.assertTrue(pool._shutdown_thread)
+
+    def test_uses_spawn_or_forkserver(self):
+        """Workers never fork the parent process."""
+        self.assertIn(self.vr._render_mp_context().get_start_method(), ("spawn", "forkserver"))
+
+
+if __name__ == "__main__":
+    unittest.main()